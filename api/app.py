@@ -1,19 +1,66 @@
 # api/app.py
-from flask import Flask
+import asyncio
+import atexit
+import threading
+import orjson
+from flask import Flask, make_response
+from flask.json.provider import JSONProvider
 from flask_restful import Api
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+def output_json(data, code, headers=None):
+    """Flask-RESTful representation that encodes resource responses with orjson."""
+    resp = make_response(orjson.dumps(data, default=str, option=_ORJSON_OPTIONS), code)
+    resp.headers['Content-Type'] = 'application/json'
+    resp.headers.extend(headers or {})
+    return resp
+
+def _start_background_loop():
+    """Start an event loop in a daemon thread and return it.
+    
+    The loop is stopped at interpreter exit.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="api-bg-loop", daemon=True)
+    thread.start()
+    atexit.register(_stop_background_loop, loop, thread)
+    return loop
+
+def _stop_background_loop(loop, thread):
+    """Stop a loop started by _start_background_loop and wait for its thread."""
+    if loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
 def create_app(config):
     """Create and configure Flask application."""
     app = Flask(__name__, static_folder='static', static_url_path='')
+    app.json = OrjsonProvider(app)
     
     # Configure Flask app
     app.config['ENV'] = 'development' if config.API.get('DEBUG', False) else 'production'
     
+    # Long-lived event loop for coroutines submitted from request handlers
+    app.config['BG_LOOP'] = _start_background_loop()
+    
     # Initialize API
     api = Api(app)
+    api.representations['application/json'] = output_json
     
     # Import routes here to avoid circular imports
     from api.routes import register_routes
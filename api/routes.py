@@ -1,10 +1,18 @@
 # api/routes.py
-from flask import request
+from flask import request, current_app, json
 from flask_restful import Resource
 from utils.logger import get_logger
+from modules.blockchain import BlockchainEvent
 import asyncio
+import concurrent.futures
+import hashlib
+import orjson
+import queue
+import threading
 import time
-from datetime import datetime
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
 
 logger = get_logger(__name__)
 
@@ -13,14 +21,306 @@ _blockchain_monitor = None
 _ai_module = None
 _discord_bot = None
 
+# LRU cache of answers keyed by normalized question text
+_QA_CACHE_SIZE = 1024
+_qa_cache = OrderedDict()
+_qa_cache_lock = threading.Lock()
+
+# Response skeletons copied per request, so key order and defaults are fixed once
+_STATUS_TEMPLATE = {
+    "status": "degraded",
+    "components": {},
+    "version": "1.0.0",
+    "timestamp": None
+}
+
+_METRICS_TEMPLATE = {
+    "events_processed": 0,
+    "significant_events": 0,
+    "last_processed_version": 0,
+    "monitored_accounts": 0,
+    "event_handles": 0,
+    "polling_interval": 60,
+    "uptime": 0,
+    "account_list": [],
+    "start_time": 0,
+    "is_monitoring": False,
+    "latest_version": 0,
+    "system_status": {},
+    "event_distribution": {},
+    "events_last_24h": 0,
+    "top_tokens": {},
+    "top_accounts": {},
+    "top_collections": {},
+    "total_events_tracked": 0,
+    "version_delta": 0
+}
+
+# Callable returning the latest ledger version, chosen in initialize_modules
+_latest_version_caller = None
+
+# Last fetched ledger version, reused for a few seconds across metrics requests
+_latest_version_cache = {"value": 0, "time": 0.0}
+
+# Computed metrics, reused for up to _METRICS_CACHE_TTL seconds while the monitor state is unchanged
+_METRICS_CACHE_TTL = 2.0
+# Replaced as a whole under _metrics_cache_lock, so the metrics and their ETag always match
+_metrics_cache = {"sig": None, "time": 0.0, "metrics": None, "etag": None}
+_metrics_cache_lock = threading.Lock()
+
+# Optional sections of the /api/events response, selectable with ?fields=
+_EVENTS_SECTIONS = frozenset(("events", "available_filters", "stats"))
+
+# Random per-process token prefixed to ETags. Version counters restart at 0
+# with the process, so without it a client could get a false 304 after a restart
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+# Serialized /api/events responses keyed by the normalized filter parameters,
+# valid while the monitor's events_version is unchanged; bounded as an LRU
+_EVENTS_CACHE_SIZE = 64
+_events_cache = {"version": -1, "responses": OrderedDict()}
+_events_cache_lock = threading.Lock()
+# Stands in for the response timestamp in cached bodies, filled in per request
+_EVENTS_TIMESTAMP_PLACEHOLDER = "__events_timestamp__"
+
+def _component_status():
+    """Return the online/offline state of each core module."""
+    return {
+        "blockchain_module": "online" if _blockchain_monitor else "offline",
+        "ai_module": "online" if _ai_module else "offline",
+        "discord_bot": "online" if _discord_bot else "offline"
+    }
+
+def _overall_status(components):
+    """Return the overall system status for a components dict."""
+    return "operational" if all(s == "online" for s in components.values()) else "degraded"
+
+# Component status only changes when module references change, so cache it
+_cached_components = _component_status()
+_cached_overall = _overall_status(_cached_components)
+
+# Serialized /api/status body with a timestamp placeholder, rebuilt when
+# _status_version moves (bumped whenever the component state is recomputed)
+_STATUS_TIMESTAMP_PLACEHOLDER = "__status_timestamp__"
+_status_version = 0
+_status_cache = {"version": -1, "body": None}
+
+# Background processing of submitted events: (job_id, event, loop) tuples
+# are consumed by worker threads, and job status is kept for polling. Queued
+# and running jobs together fit in the job table, so their status is never evicted
+_EVENT_JOB_WORKERS = 2
+_MAX_EVENT_JOBS = 1000
+_event_job_queue = queue.Queue(maxsize=_MAX_EVENT_JOBS - _EVENT_JOB_WORKERS)
+_event_jobs = OrderedDict()
+_event_jobs_lock = threading.Lock()
+_event_workers = []
+
+# Monitor attributes the handlers read directly, with the value to use if one is missing
+_MONITOR_DEFAULTS = (
+    ('recent_events', []),
+    ('events_version', 0),
+    ('running', False),
+    ('events_processed_count', 0),
+    ('significant_events_count', 0),
+)
+
 def initialize_modules(blockchain_monitor, ai_module, discord_bot):
     """Initialize module references."""
-    global _blockchain_monitor, _ai_module, _discord_bot
+    global _blockchain_monitor, _ai_module, _discord_bot, _cached_components, _cached_overall, _status_version
     _blockchain_monitor = blockchain_monitor
     _ai_module = ai_module
     _discord_bot = discord_bot
+    if _blockchain_monitor is not None:
+        # Fill in any missing attributes once so handlers can read them directly
+        for name, default in _MONITOR_DEFAULTS:
+            if not hasattr(_blockchain_monitor, name):
+                setattr(_blockchain_monitor, name, default)
+    _cached_components = _component_status()
+    _cached_overall = _overall_status(_cached_components)
+    _status_version += 1
+    _set_latest_version_caller()
+    _start_event_workers()
     logger.info("API routes initialized with module references")
 
+def _set_latest_version_caller():
+    """Pick how to call the monitor's get_latest_version, once per module setup."""
+    global _latest_version_caller
+    get_latest_version_method = getattr(_blockchain_monitor, 'get_latest_version', None)
+    
+    if get_latest_version_method is None:
+        _latest_version_caller = None
+    elif asyncio.iscoroutinefunction(get_latest_version_method):
+        run_on_poll_loop = getattr(_blockchain_monitor, 'run_on_poll_loop', None)
+        if run_on_poll_loop is not None:
+            # Run it on the monitor's own loop; its async node client is bound to that loop
+            _latest_version_caller = lambda: run_on_poll_loop(get_latest_version_method(), timeout=5)
+        else:
+            # Otherwise run it on the background event loop
+            _latest_version_caller = lambda: _run_coroutine(get_latest_version_method(), timeout=5)
+    else:
+        # If it's a regular function, just call it
+        _latest_version_caller = get_latest_version_method
+
+def _start_event_workers():
+    """Start the worker threads that process queued events (once)."""
+    if _event_workers:
+        return
+    for i in range(_EVENT_JOB_WORKERS):
+        worker = threading.Thread(target=_event_job_worker, name=f"event-job-{i}", daemon=True)
+        worker.start()
+        _event_workers.append(worker)
+
+def _set_event_job(job_id, **fields):
+    """Create or update a job's status, forgetting the oldest jobs beyond the limit.
+    
+    Jobs stay in submission order; moving updated jobs to the end would let
+    finished jobs push still-queued ones out.
+    """
+    with _event_jobs_lock:
+        job = _event_jobs.setdefault(job_id, {"job_id": job_id})
+        job.update(fields)
+        while len(_event_jobs) > _MAX_EVENT_JOBS:
+            _event_jobs.popitem(last=False)
+
+def _drop_event_job(job_id):
+    """Forget a job that was never queued."""
+    with _event_jobs_lock:
+        _event_jobs.pop(job_id, None)
+
+def _get_event_job(job_id):
+    """Return a copy of a job's status, or None if it is unknown."""
+    with _event_jobs_lock:
+        job = _event_jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+def _event_job_worker():
+    """Generate posts for queued events and hand them to the Discord bot."""
+    while True:
+        job_id, event, loop = _event_job_queue.get()
+        try:
+            _set_event_job(job_id, status="running")
+            
+            # Generate content
+            post = _ai_module.generate_post(event)
+            
+            # Queue for posting without waiting for Discord
+            future = asyncio.run_coroutine_threadsafe(_discord_bot.post_content(post), loop)
+            future.add_done_callback(_log_future_error)
+            
+            _set_event_job(job_id, status="done", content=post["content"])
+        except Exception as e:
+            logger.error("Error processing event job %s: %s", job_id, e)
+            _set_event_job(job_id, status="failed", error=str(e))
+        finally:
+            _event_job_queue.task_done()
+
+def _run_coroutine(coro, timeout=10):
+    """Run a coroutine on the app's background event loop and wait for its result.
+    
+    Safe to call from any request thread, including ones that already run an
+    event loop, since the coroutine never executes on the calling thread.
+    
+    Args:
+        coro: The coroutine to run
+        timeout: Seconds to wait for the result
+        
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, current_app.config['BG_LOOP'])
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+def _get_latest_version(max_age=5.0):
+    """Get the latest ledger version, reusing the last answer for max_age seconds.
+    
+    Args:
+        max_age: Seconds a fetched version stays valid
+        
+    Returns:
+        int: The latest version, or 0 if it could not be fetched
+    """
+    now = time.time()
+    if now - _latest_version_cache["time"] < max_age:
+        return _latest_version_cache["value"]
+    
+    latest_version = 0
+    if _latest_version_caller is not None:
+        try:
+            latest_version = _latest_version_caller()
+        except Exception as e:
+            logger.error("Error getting latest version: %s", e)
+            latest_version = 0
+    
+    _latest_version_cache["value"] = latest_version
+    _latest_version_cache["time"] = now
+    return latest_version
+
+def _log_future_error(future):
+    """Done-callback that logs the exception of a failed background coroutine."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Error in background task: %s", future.exception())
+
+def _submit_coroutine(coro):
+    """Schedule a coroutine on the background event loop without waiting for it.
+    
+    Args:
+        coro: The coroutine to run
+        
+    Returns:
+        concurrent.futures.Future: Future for the coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, current_app.config['BG_LOOP'])
+    future.add_done_callback(_log_future_error)
+    return future
+
+def _json_body():
+    """Parse the request body as JSON with the app's orjson provider.
+    
+    The parsed body is not cached on the request since each handler reads it once.
+    
+    Returns:
+        The decoded JSON value, or None if the body is missing or not valid JSON
+    """
+    return request.get_json(silent=True, cache=False)
+
+def _json_response(body, etag):
+    """Build a JSON response from an already serialized body."""
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+def _metrics_etag(metrics):
+    """Return an ETag derived from the content of a metrics dict.
+    
+    uptime is left out: it changes every second, and the dashboard counts it
+    up from start_time itself. Keys are sorted so equal metrics hash equally.
+    """
+    body = orjson.dumps({key: value for key, value in metrics.items() if key != "uptime"},
+                        default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+    return f"metrics-{_BOOT_ID}-{hashlib.blake2b(body, digest_size=8).hexdigest()}"
+
+def _store_metrics_cache(entry):
+    """Swap in a newly computed metrics cache entry."""
+    global _metrics_cache
+    with _metrics_cache_lock:
+        _metrics_cache = entry
+
+def _metrics_response(entry):
+    """Build the /api/metrics response for a cache entry, or 304 if the client has it."""
+    etag = entry["etag"]
+    if etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return _json_response(json.dumps({
+        "metrics": entry["metrics"],
+        "timestamp": datetime.now(timezone.utc)
+    }), etag)
+
 class EventResource(Resource):
     """Resource for handling blockchain events."""
     
@@ -29,39 +329,46 @@ class EventResource(Resource):
         if not _ai_module or not _discord_bot:
             return {"error": "API not fully initialized"}, 500
             
-        data = request.get_json()
+        data = _json_body()
         if not data:
             return {"error": "No data provided"}, 400
+        if not isinstance(data, dict):
+            return {"error": "Invalid data format. Expected a JSON object."}, 400
         
         try:
-            # Create dummy event object if needed
-            if not hasattr(data, 'to_dict'):
-                from modules.blockchain import BlockchainEvent
-                # Convert dict to event
-                event = BlockchainEvent(
-                    data.get("event_type", "unknown_event"),
-                    data.get("details", {}),
-                    data.get("importance_score", 0.5)
-                )
-            else:
-                event = data
-                
-            # Generate content
-            post = _ai_module.generate_post(event)
-            
-            # Queue for posting
-            asyncio.run(_discord_bot.post_content(post))
+            # Convert request body to event
+            event = BlockchainEvent.from_request(data)
+            
+            # Hand off to the event workers; content generation can take seconds
+            job_id = uuid.uuid4().hex
+            _set_event_job(job_id, status="pending")
+            try:
+                _event_job_queue.put_nowait((job_id, event, current_app.config['BG_LOOP']))
+            except queue.Full:
+                _drop_event_job(job_id)
+                return {"error": "Too many events queued for processing. Try again later."}, 503
             
             return {
                 "success": True,
-                "message": "Event processed successfully",
-                "content": post["content"]
-            }
+                "message": "Event accepted for processing",
+                "job_id": job_id,
+                "status": "pending"
+            }, 202
             
         except Exception as e:
-            logger.error(f"Error processing event: {str(e)}")
+            logger.error("Error processing event: %s", e)
             return {"error": str(e)}, 500
 
+class EventJobResource(Resource):
+    """Resource for checking the status of a submitted event."""
+    
+    def get(self, job_id):
+        """Get the processing status of an event job."""
+        job = _get_event_job(job_id)
+        if job is None:
+            return {"error": "Unknown job id"}, 404
+        return job
+
 class MemeResource(Resource):
     """Resource for generating memes."""
     
@@ -70,39 +377,55 @@ class MemeResource(Resource):
         if not _ai_module or not _discord_bot:
             return {"error": "API not fully initialized"}, 500
             
-        data = request.get_json()
+        data = _json_body()
         if not data:
             return {"error": "No data provided"}, 400
+        if not isinstance(data, dict):
+            return {"error": "Invalid data format. Expected a JSON object."}, 400
         
         try:
-            # Create dummy event object if needed
-            if not hasattr(data, 'to_dict'):
-                from modules.blockchain import BlockchainEvent
-                # Convert dict to event
-                event = BlockchainEvent(
-                    data.get("event_type", "unknown_event"),
-                    data.get("details", {}),
-                    data.get("importance_score", 0.5)
-                )
-            else:
-                event = data
-                
+            # Convert request body to event
+            event = BlockchainEvent.from_request(data)
+            
+            # generate_meme works on flat monitor-style event dicts
+            details = event.data if isinstance(event.data, dict) else {}
+            meme_event = dict(details, type=event.event_type,
+                              event_category=event.category or event.event_type)
+            
             # Generate meme
-            meme = _ai_module.generate_meme(event)
+            meme = _ai_module.generate_meme(meme_event)
             
-            # Queue for posting
-            asyncio.run(_discord_bot.post_content(meme))
+            # Queue for posting without waiting for Discord
+            _submit_coroutine(_discord_bot.post_content(meme))
             
             return {
                 "success": True,
                 "message": "Meme generated successfully",
-                "meme_text": meme["text"]
+                "meme_text": meme.get("text", meme.get("message"))
             }
             
         except Exception as e:
-            logger.error(f"Error generating meme: {str(e)}")
+            logger.error("Error generating meme: %s", e)
             return {"error": str(e)}, 500
 
+def _get_cached_answer(question):
+    """Return a cached answer for the question, or None on a miss."""
+    key = question.strip().lower()
+    with _qa_cache_lock:
+        answer = _qa_cache.get(key)
+        if answer is not None:
+            _qa_cache.move_to_end(key)
+        return answer
+
+def _store_cached_answer(question, answer):
+    """Store an answer, evicting the least recently used entry when full."""
+    key = question.strip().lower()
+    with _qa_cache_lock:
+        _qa_cache[key] = answer
+        _qa_cache.move_to_end(key)
+        if len(_qa_cache) > _QA_CACHE_SIZE:
+            _qa_cache.popitem(last=False)
+
 class QuestionResource(Resource):
     """Resource for handling questions."""
     
@@ -111,13 +434,18 @@ class QuestionResource(Resource):
         if not _ai_module:
             return {"error": "API not fully initialized"}, 500
             
-        data = request.get_json()
+        data = _json_body()
         if not data or 'question' not in data:
             return {"error": "No question provided"}, 400
         
         try:
-            # Get answer from AI module
-            answer = _ai_module.get_answer(data['question'])
+            # Serve repeated questions from the cache before asking the AI module
+            answer = _get_cached_answer(data['question'])
+            if answer is None:
+                answer = _ai_module.get_answer(data['question'])
+                # Don't pin the generic fallback answer given when the LLM is unavailable
+                if answer.get("confidence", 0) >= 0.5:
+                    _store_cached_answer(data['question'], answer)
             
             return {
                 "success": True,
@@ -126,7 +454,7 @@ class QuestionResource(Resource):
             }
             
         except Exception as e:
-            logger.error(f"Error answering question: {str(e)}")
+            logger.error("Error answering question: %s", e)
             return {"error": str(e)}, 500
 
 class StatusResource(Resource):
@@ -134,20 +462,46 @@ class StatusResource(Resource):
     
     def get(self):
         """Get system status."""
-        components = {
-            "blockchain_module": "online" if _blockchain_monitor else "offline",
-            "ai_module": "online" if _ai_module else "offline",
-            "discord_bot": "online" if _discord_bot else "offline"
-        }
+        if _status_cache["version"] != _status_version:
+            status = _STATUS_TEMPLATE.copy()
+            status["status"] = _cached_overall
+            status["components"] = dict(_cached_components)
+            status["timestamp"] = _STATUS_TIMESTAMP_PLACEHOLDER
+            _status_cache["body"] = json.dumps(status)
+            _status_cache["version"] = _status_version
         
-        overall_status = "operational" if all(s == "online" for s in components.values()) else "degraded"
-        
-        return {
-            "status": overall_status,
-            "components": components,
-            "version": "1.0.0",
-            "timestamp": datetime.now().isoformat()
-        }
+        timestamp = datetime.now(timezone.utc).isoformat()
+        body = _status_cache["body"].replace(_STATUS_TIMESTAMP_PLACEHOLDER, timestamp, 1)
+        return current_app.response_class(body, mimetype='application/json')
+
+def _get_cached_events_body(events_version, key):
+    """Return the cached /api/events body for a filter key, or None on a miss."""
+    with _events_cache_lock:
+        if _events_cache["version"] != events_version:
+            return None
+        responses = _events_cache["responses"]
+        body = responses.get(key)
+        if body is not None:
+            responses.move_to_end(key)
+        return body
+
+def _store_cached_events_body(events_version, key, body):
+    """Cache an /api/events body, starting over when the event list has changed."""
+    with _events_cache_lock:
+        if _events_cache["version"] != events_version:
+            _events_cache["version"] = events_version
+            _events_cache["responses"] = OrderedDict()
+        responses = _events_cache["responses"]
+        responses[key] = body
+        responses.move_to_end(key)
+        if len(responses) > _EVENTS_CACHE_SIZE:
+            responses.popitem(last=False)
+
+def _fill_events_timestamp(body):
+    """Put the current time into a cached /api/events body."""
+    # The timestamp is the payload's last key, so its placeholder is the last occurrence
+    head, _, tail = body.rpartition(_EVENTS_TIMESTAMP_PLACEHOLDER)
+    return head + datetime.now(timezone.utc).isoformat() + tail
 
 class EventsResource(Resource):
     """Resource for retrieving blockchain events."""
@@ -165,69 +519,91 @@ class EventsResource(Resource):
             collection = request.args.get('collection')
             limit = request.args.get('limit', 50, type=int)
             
+            # Optional comma-separated list of sections to include (default: all)
+            fields = request.args.get('fields')
+            wanted = set(fields.split(',')) if fields else _EVENTS_SECTIONS
+            
             # Get recent events from the blockchain monitor
-            events = getattr(_blockchain_monitor, 'recent_events', [])
+            events = _blockchain_monitor.recent_events
             if not events:
                 # If no events are stored, return an empty list
                 return {"events": [], "filters_applied": {}}
             
-            # Apply filters if provided
-            filtered_events = events
+            # Serve an unchanged event list from the cache, or 304 if the client has it
+            events_version = _blockchain_monitor.events_version
+            etag = f"{_BOOT_ID}-{events_version}"
+            if etag in request.if_none_match:
+                response = current_app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+            cache_key = (event_type, account, token, collection, limit, tuple(sorted(wanted)))
+            cached_body = _get_cached_events_body(events_version, cache_key)
+            if cached_body is not None:
+                return _json_response(_fill_events_timestamp(cached_body), etag)
+            
+            # Work on a consistent copy; the monitor may add events while we build the response
+            view = _blockchain_monitor.recent_events_view()
+            events = view["events"]
+            if view["events_version"] != events_version:
+                events_version = view["events_version"]
+                etag = f"{_BOOT_ID}-{events_version}"
+            
+            # Apply all provided filters through the monitor's inverted index
             filters_applied = {}
+            criteria = []
+            for name, field, value in (('event_type', 'event_category', event_type),
+                                       ('account', 'account', account),
+                                       ('token', 'token_name', token),
+                                       ('collection', 'collection_name', collection)):
+                if value:
+                    criteria.append((field, value))
+                    filters_applied[name] = value
+            
+            if criteria:
+                filtered_events = _blockchain_monitor.find_recent_events(criteria)
+            else:
+                filtered_events = events
+            total_count = len(events)
+            filtered_count = len(filtered_events)
             
-            if event_type:
-                filtered_events = [e for e in filtered_events if e.get('event_category') == event_type]
-                filters_applied['event_type'] = event_type
-                
-            if account:
-                filtered_events = [e for e in filtered_events if e.get('account') == account]
-                filters_applied['account'] = account
-                
-            if token:
-                filtered_events = [e for e in filtered_events if e.get('token_name') == token]
-                filters_applied['token'] = token
-                
-            if collection:
-                filtered_events = [e for e in filtered_events if e.get('collection_name') == collection]
-                filters_applied['collection'] = collection
-            
-            # Get available filter options from all events
-            available_filters = {
-                'event_types': list(set(e.get('event_category') for e in events if 'event_category' in e)),
-                'accounts': list(set(e.get('account') for e in events if 'account' in e)),
-                'tokens': list(set(e.get('token_name') for e in events if 'token_name' in e)),
-                'collections': list(set(e.get('collection_name') for e in events if 'collection_name' in e))
+            # Return the events with metadata
+            payload = {
+                "total_count": total_count,
+                "filtered_count": filtered_count,
+                "filters_applied": filters_applied
             }
             
-            # Calculate some statistics
-            stats = {
-                'total_events': len(events),
-                'filtered_events': len(filtered_events),
-                'event_type_distribution': {},
-                'latest_event_time': max([e.get('timestamp', '2000-01-01T00:00:00') for e in events], default='2000-01-01T00:00:00')
-            }
+            if "events" in wanted:
+                # Limit the number of events returned
+                payload["events"] = filtered_events[-limit:] if limit > 0 else filtered_events
+            
+            if "available_filters" in wanted:
+                # Get available filter options from the monitor's rolling aggregates
+                filter_values = view["filter_values"]
+                payload["available_filters"] = {
+                    'event_types': filter_values['event_category'],
+                    'accounts': filter_values['account'],
+                    'tokens': filter_values['token_name'],
+                    'collections': filter_values['collection_name']
+                }
             
-            # Calculate event type distribution
-            for event in events:
-                event_category = event.get('event_category', 'other')
-                stats['event_type_distribution'][event_category] = stats['event_type_distribution'].get(event_category, 0) + 1
+            if "stats" in wanted:
+                # Calculate some statistics
+                payload["stats"] = {
+                    'total_events': total_count,
+                    'filtered_events': filtered_count,
+                    'event_type_distribution': view["category_counts"],
+                    'latest_event_time': max(events, key=_blockchain_monitor.recent_event_epoch).get('timestamp', '2000-01-01T00:00:00')
+                }
             
-            # Limit the number of events returned
-            limited_events = filtered_events[-limit:] if limit > 0 else filtered_events
+            payload["timestamp"] = _EVENTS_TIMESTAMP_PLACEHOLDER
             
-            # Return the events with metadata
-            return {
-                "events": limited_events,
-                "total_count": len(events),
-                "filtered_count": len(filtered_events),
-                "filters_applied": filters_applied,
-                "available_filters": available_filters,
-                "stats": stats,
-                "timestamp": datetime.now().isoformat()
-            }
+            body = json.dumps(payload)
+            _store_cached_events_body(events_version, cache_key, body)
+            return _json_response(_fill_events_timestamp(body), etag)
             
         except Exception as e:
-            logger.error(f"Error retrieving events: {str(e)}")
+            logger.error("Error retrieving events: %s", e)
             return {"error": str(e)}, 500
 
 class MetricsResource(Resource):
@@ -241,173 +617,73 @@ class MetricsResource(Resource):
         try:
             # CRITICAL: Force update the metrics counters from the blockchain monitor
             # This ensures we're always returning the latest values
-            events_processed = getattr(_blockchain_monitor, 'events_processed_count', 0)
-            significant_events = getattr(_blockchain_monitor, 'significant_events_count', 0)
-            monitored_accounts = len(getattr(_blockchain_monitor, 'validated_accounts', []))
-            event_handles = len(getattr(_blockchain_monitor, 'event_handles', []))
-            
-            # Ensure events_processed is at least the number of recent events
-            recent_events = getattr(_blockchain_monitor, 'recent_events', [])
-            if events_processed < len(recent_events):
-                events_processed = len(recent_events)
-                # Update the actual counter in the blockchain monitor
-                _blockchain_monitor.events_processed_count = events_processed
+            snapshot = _blockchain_monitor.snapshot()
+            events_processed = snapshot["events_processed"]
+            significant_events = snapshot["significant_events"]
+            monitored_accounts = len(snapshot["validated_accounts"])
+            event_handles = snapshot["event_handles"]
+            recent_events = snapshot["recent_events"]
+            
+            # Reuse recently computed metrics if the monitor state is unchanged
+            sig = (snapshot["events_version"], events_processed, significant_events, snapshot["running"])
+            with _metrics_cache_lock:
+                cached = _metrics_cache
+            if cached["sig"] == sig and time.time() - cached["time"] < _METRICS_CACHE_TTL:
+                return _metrics_response(cached)
             
             # Log the metrics values for debugging
-            logger.info(f"METRICS API - Events processed: {events_processed}")
-            logger.info(f"METRICS API - Significant events: {significant_events}")
-            logger.info(f"METRICS API - Monitored accounts: {monitored_accounts}")
-            logger.info(f"METRICS API - Event handles: {event_handles}")
-            
-            # Get the latest version synchronously if it's an async method
-            latest_version = 0
-            get_latest_version_method = getattr(_blockchain_monitor, 'get_latest_version', None)
-            
-            if get_latest_version_method:
-                if asyncio.iscoroutinefunction(get_latest_version_method):
-                    # If it's an async function, run it in a new event loop
-                    try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        latest_version = loop.run_until_complete(get_latest_version_method())
-                        loop.close()
-                    except Exception as e:
-                        logger.error(f"Error getting latest version: {str(e)}")
-                        latest_version = 0
-                else:
-                    # If it's a regular function, just call it
-                    try:
-                        latest_version = get_latest_version_method()
-                    except Exception as e:
-                        logger.error(f"Error getting latest version: {str(e)}")
-                        latest_version = 0
-            
-            # Calculate event type distribution
-            event_types = {}
-            token_activity = {}
-            account_activity = {}
-            collection_activity = {}
-            
-            # Last 24 hours timestamp
-            last_24h = time.time() - (24 * 60 * 60)
-            events_24h = 0
-            
-            for event in recent_events:
-                # Count event types
-                event_category = event.get('event_category', 'other')
-                event_types[event_category] = event_types.get(event_category, 0) + 1
-                
-                # Track token activity
-                if 'token_name' in event:
-                    token_name = event.get('token_name')
-                    token_activity[token_name] = token_activity.get(token_name, 0) + 1
-                
-                # Track account activity
-                if 'account' in event:
-                    account = event.get('account')
-                    account_activity[account] = account_activity.get(account, 0) + 1
-                
-                # Track collection activity
-                if 'collection_name' in event:
-                    collection = event.get('collection_name')
-                    collection_activity[collection] = collection_activity.get(collection, 0) + 1
-                
-                # Count events in last 24 hours
-                event_time = event.get('timestamp')
-                if event_time:
-                    try:
-                        event_timestamp = datetime.fromisoformat(event_time.replace('Z', '+00:00')).timestamp()
-                        if event_timestamp > last_24h:
-                            events_24h += 1
-                    except:
-                        pass
-            
-            # Sort activity by frequency
-            top_tokens = sorted(token_activity.items(), key=lambda x: x[1], reverse=True)[:5]
-            top_accounts = sorted(account_activity.items(), key=lambda x: x[1], reverse=True)[:5]
-            top_collections = sorted(collection_activity.items(), key=lambda x: x[1], reverse=True)[:5]
+            logger.debug("METRICS API - Events processed: %s", events_processed)
+            logger.debug("METRICS API - Significant events: %s", significant_events)
+            logger.debug("METRICS API - Monitored accounts: %s", monitored_accounts)
+            logger.debug("METRICS API - Event handles: %s", event_handles)
             
-            # Get metrics from the blockchain monitor - use the values we already retrieved
-            metrics = {
-                "events_processed": events_processed,
-                "significant_events": significant_events,
-                "last_processed_version": getattr(_blockchain_monitor, 'last_processed_version', 0),
-                "monitored_accounts": monitored_accounts,
-                "event_handles": event_handles,
-                "polling_interval": getattr(_blockchain_monitor, 'polling_interval', 60),
-                "uptime": int(time.time() - getattr(_blockchain_monitor, 'start_time', time.time())),
-                "account_list": getattr(_blockchain_monitor, 'validated_accounts', []),
-                "start_time": getattr(_blockchain_monitor, 'start_time', time.time()),
-                "is_monitoring": getattr(_blockchain_monitor, 'running', False),
-                "latest_version": latest_version,
-                "system_status": {
-                    "blockchain_module": "online" if _blockchain_monitor else "offline",
-                    "ai_module": "online" if _ai_module else "offline",
-                    "discord_bot": "online" if _discord_bot else "offline"
-                },
-                # Enhanced metrics
-                "event_distribution": event_types,
-                "events_last_24h": events_24h,
-                "top_tokens": dict(top_tokens),
-                "top_accounts": dict(top_accounts),
-                "top_collections": dict(top_collections),
-                "total_events_tracked": len(recent_events),
-                "version_delta": latest_version - getattr(_blockchain_monitor, 'last_processed_version', 0) if latest_version > 0 else 0
-            }
+            latest_version = _get_latest_version()
             
-            # Add detailed metrics from the blockchain monitor if available
-            if hasattr(_blockchain_monitor, 'event_type_counts'):
-                metrics["detailed_event_types"] = getattr(_blockchain_monitor, 'event_type_counts', {})
-                
-            if hasattr(_blockchain_monitor, 'account_activity'):
-                # Get top 10 accounts by activity
-                account_data = getattr(_blockchain_monitor, 'account_activity', {})
-                top_accounts_detailed = sorted(
-                    account_data.items(), 
-                    key=lambda x: x[1]['total_events'] if isinstance(x[1], dict) and 'total_events' in x[1] else 0, 
-                    reverse=True
-                )[:10]
-                metrics["detailed_account_activity"] = dict(top_accounts_detailed)
-                
-            if hasattr(_blockchain_monitor, 'token_activity'):
-                # Get top 10 tokens by activity
-                token_data = getattr(_blockchain_monitor, 'token_activity', {})
-                top_tokens_detailed = sorted(
-                    token_data.items(), 
-                    key=lambda x: x[1]['total_events'] if isinstance(x[1], dict) and 'total_events' in x[1] else 0, 
-                    reverse=True
-                )[:10]
-                metrics["detailed_token_activity"] = dict(top_tokens_detailed)
-                
-            if hasattr(_blockchain_monitor, 'collection_activity'):
-                # Get top 10 collections by activity
-                collection_data = getattr(_blockchain_monitor, 'collection_activity', {})
-                top_collections_detailed = sorted(
-                    collection_data.items(), 
-                    key=lambda x: x[1]['total_events'] if isinstance(x[1], dict) and 'total_events' in x[1] else 0, 
-                    reverse=True
-                )[:10]
-                metrics["detailed_collection_activity"] = dict(top_collections_detailed)
-                
-            if hasattr(_blockchain_monitor, 'hourly_event_counts'):
-                metrics["hourly_event_counts"] = getattr(_blockchain_monitor, 'hourly_event_counts', [0] * 24)
-                
-            if hasattr(_blockchain_monitor, 'daily_event_counts'):
-                metrics["daily_event_counts"] = getattr(_blockchain_monitor, 'daily_event_counts', [0] * 7)
-                
-            if hasattr(_blockchain_monitor, 'version_history'):
-                # Get the last 60 entries (1 hour at 1 per minute)
-                version_history = getattr(_blockchain_monitor, 'version_history', [])
-                metrics["version_history"] = version_history[-60:] if version_history else []
+            # Read the clock once for the whole response
+            now = time.time()
+            events_24h = _blockchain_monitor.tick_24h_window(now)
+            start_time = snapshot["start_time"]
+            last_processed_version = snapshot["last_processed_version"]
             
-            # Use datetime.now() directly instead of asyncio.to_thread
-            return {
-                "metrics": metrics,
-                "timestamp": datetime.now().isoformat()
-            }
+            # Get metrics from the blockchain monitor - use the values we already retrieved
+            metrics = _METRICS_TEMPLATE.copy()
+            metrics["events_processed"] = events_processed
+            metrics["significant_events"] = significant_events
+            metrics["last_processed_version"] = last_processed_version
+            metrics["monitored_accounts"] = monitored_accounts
+            metrics["event_handles"] = event_handles
+            metrics["polling_interval"] = snapshot["polling_interval"]
+            metrics["uptime"] = int(now - start_time)
+            metrics["account_list"] = snapshot["validated_accounts"]
+            metrics["start_time"] = start_time
+            metrics["is_monitoring"] = snapshot["running"]
+            metrics["latest_version"] = latest_version
+            metrics["system_status"] = dict(_cached_components)
+            # Enhanced metrics
+            metrics["event_distribution"] = snapshot["recent_category_counts"]
+            metrics["events_last_24h"] = events_24h
+            metrics["top_tokens"] = snapshot["top_recent_tokens"]
+            metrics["top_accounts"] = snapshot["top_recent_accounts"]
+            metrics["top_collections"] = snapshot["top_recent_collections"]
+            metrics["total_events_tracked"] = len(recent_events)
+            metrics["version_delta"] = latest_version - last_processed_version if latest_version > 0 else 0
+            
+            # Add detailed metrics from the blockchain monitor snapshot
+            metrics["detailed_event_types"] = snapshot["event_type_counts"]
+            # Top 10 accounts, tokens and collections by activity
+            metrics["detailed_account_activity"] = snapshot["top_account_activity"]
+            metrics["detailed_token_activity"] = snapshot["top_token_activity"]
+            metrics["detailed_collection_activity"] = snapshot["top_collection_activity"]
+            metrics["hourly_event_counts"] = snapshot["hourly_event_counts"]
+            metrics["daily_event_counts"] = snapshot["daily_event_counts"]
+            metrics["version_history"] = snapshot["version_history"]
+            
+            entry = {"sig": sig, "time": now, "metrics": metrics, "etag": _metrics_etag(metrics)}
+            _store_metrics_cache(entry)
+            return _metrics_response(entry)
             
         except Exception as e:
-            logger.error(f"Error retrieving metrics: {str(e)}")
+            logger.error("Error retrieving metrics: %s", e)
             return {"error": str(e)}, 500
 
 class ControlResource(Resource):
@@ -418,7 +694,7 @@ class ControlResource(Resource):
         if not _blockchain_monitor:
             return {"error": "Blockchain monitor not initialized"}, 500
             
-        data = request.get_json()
+        data = _json_body()
         if not data:
             return {"error": "No data provided"}, 400
             
@@ -431,20 +707,20 @@ class ControlResource(Resource):
             
             if action == "start":
                 # Start monitoring if not already running
-                if not getattr(_blockchain_monitor, 'running', False):
+                if not _blockchain_monitor.running:
                     # This would normally be handled by the main application
                     # Here we'll just update the status
-                    setattr(_blockchain_monitor, 'running', True)
+                    _blockchain_monitor.running = True
                     result = {"success": True, "message": "Monitoring started"}
                 else:
                     result = {"success": False, "message": "Already running"}
                     
             elif action == "stop":
                 # Stop monitoring if running
-                if getattr(_blockchain_monitor, 'running', False):
+                if _blockchain_monitor.running:
                     # This would normally be handled by the main application
                     # Here we'll just update the status
-                    setattr(_blockchain_monitor, 'running', False)
+                    _blockchain_monitor.running = False
                     result = {"success": True, "message": "Monitoring stopped"}
                 else:
                     result = {"success": False, "message": "Not running"}
@@ -453,7 +729,7 @@ class ControlResource(Resource):
                 # Update polling interval
                 interval = data.get("interval")
                 if interval and isinstance(interval, int) and interval > 0:
-                    setattr(_blockchain_monitor, 'polling_interval', interval)
+                    _blockchain_monitor.polling_interval = interval
                     result = {"success": True, "message": f"Polling interval updated to {interval} seconds"}
                 else:
                     result = {"success": False, "message": "Invalid interval"}
@@ -461,7 +737,7 @@ class ControlResource(Resource):
             return result
             
         except Exception as e:
-            logger.error(f"Error controlling blockchain monitor: {str(e)}")
+            logger.error("Error controlling blockchain monitor: %s", e)
             return {"error": str(e)}, 500
 
 class TestEventsResource(Resource):
@@ -473,36 +749,29 @@ class TestEventsResource(Resource):
             return {"error": "Blockchain monitor or Discord bot not initialized"}, 500
             
         try:
-            data = request.get_json()
+            data = _json_body()
             if not data or not isinstance(data, list):
                 return {"error": "Invalid data format. Expected a list of events."}, 400
+            if not all(isinstance(event, dict) for event in data):
+                return {"error": "Invalid data format. Each event must be a JSON object."}, 400
             
-            # Generate unique IDs for events if not present
+            # Add events to blockchain monitor's recent_events; ids it already holds are skipped
+            new_events = []
             for event in data:
+                # Generate unique IDs for events if not present
                 if 'id' not in event:
-                    event['id'] = f"test_{int(time.time())}_{hash(str(event))}"
-            
-            # Add events to blockchain monitor's recent_events
-            for event in data:
-                if event not in _blockchain_monitor.recent_events:
-                    _blockchain_monitor.recent_events.append(event)
-            
-            # Ensure recent_events doesn't exceed 100 items
-            if len(_blockchain_monitor.recent_events) > 100:
-                _blockchain_monitor.recent_events = _blockchain_monitor.recent_events[-100:]
+                    event['id'] = f"test_{uuid.uuid4().hex}"
+                if _blockchain_monitor.add_recent_event(event):
+                    new_events.append(event)
             
             # Update metrics - IMPORTANT: This is what updates the UI
             _blockchain_monitor.events_processed_count += len(data)
             
             # Log the updated metrics for debugging
-            logger.info(f"TEST EVENTS - Updated events_processed_count to {_blockchain_monitor.events_processed_count}")
+            logger.info("TEST EVENTS - Updated events_processed_count to %s", _blockchain_monitor.events_processed_count)
             
-            # Update event type counts
-            for event in data:
-                event_category = event.get('event_category', 'other')
-                if not hasattr(_blockchain_monitor, 'event_type_counts'):
-                    _blockchain_monitor.event_type_counts = {}
-                _blockchain_monitor.event_type_counts[event_category] = _blockchain_monitor.event_type_counts.get(event_category, 0) + 1
+            # Update event type counts for the events that were actually added
+            _blockchain_monitor.event_type_counts.update(e.get('event_category', 'other') for e in new_events)
             
             # Send only one event to Discord (the most recent one)
             sent_count = 0
@@ -513,14 +782,14 @@ class TestEventsResource(Resource):
                     
                     # Mark as significant event
                     _blockchain_monitor.significant_events_count += 1
-                    logger.info(f"TEST EVENTS - Updated significant_events_count to {_blockchain_monitor.significant_events_count}")
+                    logger.info("TEST EVENTS - Updated significant_events_count to %s", _blockchain_monitor.significant_events_count)
                     
-                    # Post event to Discord
-                    _discord_bot.post_blockchain_event(most_recent_event)
+                    # Post event to Discord in the background; insight generation can be slow
+                    _submit_coroutine(asyncio.to_thread(_discord_bot.post_blockchain_event, most_recent_event))
                     sent_count = 1
-                    logger.info(f"Posted most recent event to Discord: {most_recent_event.get('event_category', 'unknown')}")
+                    logger.info("Queued most recent event for Discord: %s", most_recent_event.get('event_category', 'unknown'))
                 except Exception as e:
-                    logger.error(f"Error posting event to Discord: {str(e)}")
+                    logger.error("Error posting event to Discord: %s", e)
             
             # Force update the metrics in the blockchain monitor
             # This ensures they're properly reflected in the UI
@@ -540,15 +809,22 @@ class TestEventsResource(Resource):
             }
             
         except Exception as e:
-            logger.error(f"Error adding test events: {str(e)}")
+            logger.error("Error adding test events: %s", e)
             return {"error": str(e)}, 500
 
+# Worker pool for blockchain polling triggered by page loads
+_page_load_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='page-load')
+
 class PageLoadResource(Resource):
     """Resource for handling page load events."""
     
     # Keep track of the last processed time to limit processing frequency
     last_processed_time = datetime.now()
     active_user_count = 0
+    _counter_lock = threading.Lock()
+    
+    # Future of the processing run in progress, so runs never overlap
+    _inflight = None
     
     def post(self):
         """Handle page load event and trigger blockchain events processing."""
@@ -561,43 +837,46 @@ class PageLoadResource(Resource):
             client_ip = request.remote_addr
             user_agent = request.headers.get('User-Agent', 'Unknown')
             
-            # Increment active user count
-            PageLoadResource.active_user_count += 1
+            # Increment active user count; += on a class attribute is not atomic across threads
+            with PageLoadResource._counter_lock:
+                PageLoadResource.active_user_count += 1
+                active_users = PageLoadResource.active_user_count
             
             # Log page load
-            logger.info(f"Page load from {client_ip} with agent {user_agent}")
+            logger.info("Page load from %s with agent %s", client_ip, user_agent)
             
             # Only process events if it's been more than 5 minutes since last process
             # and we have active users
-            should_process = time_diff > 300 and PageLoadResource.active_user_count > 0
+            should_process = time_diff > 300 and active_users > 0
+            inflight = PageLoadResource._inflight
             
-            if should_process:
+            if should_process and inflight is not None and not inflight.done():
+                logger.info("Skipping blockchain processing (previous run still in progress)")
+                process_status = "skipped"
+            elif should_process:
                 # Reset timer
                 PageLoadResource.last_processed_time = current_time
                 
-                # Process events in a non-blocking way
-                import threading
-                threading.Thread(
-                    target=self._process_events_thread,
-                    args=(_blockchain_monitor, _discord_bot),
-                    daemon=True
-                ).start()
+                # Process events in a non-blocking way on the shared pool
+                PageLoadResource._inflight = _page_load_executor.submit(
+                    self._process_events_thread, _blockchain_monitor, _discord_bot
+                )
                 
                 logger.info("Triggered blockchain events processing due to page load")
                 process_status = "processing_triggered"
             else:
-                logger.info(f"Skipping blockchain processing (last process: {time_diff:.0f} seconds ago)")
+                logger.info("Skipping blockchain processing (last process: %.0f seconds ago)", time_diff)
                 process_status = "skipped"
             
             return {
                 "success": True,
-                "active_users": PageLoadResource.active_user_count,
+                "active_users": active_users,
                 "processing_status": process_status,
                 "message": "Page load registered"
             }
             
         except Exception as e:
-            logger.error(f"Error handling page load: {str(e)}")
+            logger.error("Error handling page load: %s", e)
             return {"error": str(e)}, 500
     
     def _process_events_thread(self, blockchain_monitor, discord_bot):
@@ -609,19 +888,19 @@ class PageLoadResource(Resource):
             events = blockchain_monitor.poll_for_events(discord_bot)
             
             if events:
-                logger.info(f"Processed {len(events)} events from user page load trigger")
+                logger.info("Processed %s events from user page load trigger", len(events))
             else:
                 logger.info("No new events found from user page load trigger")
                 
         except Exception as e:
-            logger.error(f"Error in blockchain processing thread: {str(e)}")
+            logger.error("Error in blockchain processing thread: %s", e)
     
     def get(self):
         """Get current active user count."""
         return {
             "active_users": PageLoadResource.active_user_count,
-            "last_processed": PageLoadResource.last_processed_time.isoformat(),
-            "timestamp": datetime.now().isoformat()
+            "last_processed": PageLoadResource.last_processed_time,
+            "timestamp": datetime.now()
         }
 
 class DiscordTestResource(Resource):
@@ -634,10 +913,7 @@ class DiscordTestResource(Resource):
             
         try:
             # Test the Discord connection using direct webhook
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            success = loop.run_until_complete(_discord_bot.test_webhook_directly())
-            loop.close()
+            success = _run_coroutine(_discord_bot.test_webhook_directly())
             
             if success:
                 return {
@@ -660,12 +936,66 @@ class DiscordTestResource(Resource):
                     }
             
         except Exception as e:
-            logger.error(f"Error testing Discord connection: {str(e)}")
+            logger.error("Error testing Discord connection: %s", e)
             return {"error": str(e)}, 500
 
+class BatchResource(Resource):
+    """Resource for fetching several read-only endpoints in one request."""
+    
+    def post(self):
+        """Run a batch of GET requests in-process.
+        
+        Expects {"requests": [{"path": "/api/status"}, {"path": "/api/metrics?fields=x"}]}
+        and returns one {"path", "status", "body"} entry per request, in order.
+        """
+        data = _json_body()
+        if not isinstance(data, dict) or not isinstance(data.get("requests"), list):
+            return {"error": "Invalid data format. Expected a list of requests."}, 400
+        if len(data["requests"]) > _MAX_BATCH_REQUESTS:
+            return {"error": f"Too many requests in one batch (at most {_MAX_BATCH_REQUESTS})."}, 400
+        
+        responses = []
+        for entry in data["requests"]:
+            path = entry.get("path", "") if isinstance(entry, dict) else ""
+            if not isinstance(path, str):
+                path = ""
+            resource_class = _BATCH_RESOURCES.get(path.split('?', 1)[0])
+            if resource_class is None:
+                responses.append({"path": path, "status": 404, "body": {"error": "Unsupported batch path"}})
+                continue
+            
+            try:
+                # Give the resource its own request context so request.args reflects the path
+                with current_app.test_request_context(path, method='GET'):
+                    result = resource_class().get()
+                
+                if isinstance(result, current_app.response_class):
+                    status, body = result.status_code, result.get_json()
+                elif isinstance(result, tuple):
+                    body, status = result[0], result[1]
+                else:
+                    body, status = result, 200
+                responses.append({"path": path, "status": status, "body": body})
+            except Exception as e:
+                logger.error("Error processing batch request for %s: %s", path, e)
+                responses.append({"path": path, "status": 500, "body": {"error": str(e)}})
+        
+        return {"responses": responses}
+
+# Most requests one /api/batch call may carry
+_MAX_BATCH_REQUESTS = 10
+
+# Read-only resources that can be fetched through /api/batch
+_BATCH_RESOURCES = {
+    '/api/status': StatusResource,
+    '/api/events': EventsResource,
+    '/api/metrics': MetricsResource
+}
+
 def register_routes(api):
     """Register API routes."""
     api.add_resource(EventResource, '/api/event')
+    api.add_resource(EventJobResource, '/api/event/<string:job_id>')
     api.add_resource(MemeResource, '/api/meme')
     api.add_resource(QuestionResource, '/api/question')
     api.add_resource(StatusResource, '/api/status')
@@ -675,4 +1005,5 @@ def register_routes(api):
     api.add_resource(TestEventsResource, '/api/test_events')
     api.add_resource(PageLoadResource, '/api/page_load')
     api.add_resource(DiscordTestResource, '/api/test_discord')
+    api.add_resource(BatchResource, '/api/batch')
     logger.info("API routes registered")
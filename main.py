@@ -2,6 +2,7 @@
 import threading
 import asyncio
 import os
+import random
 import time
 import signal
 import sys
@@ -18,6 +19,10 @@ from utils.cache import Cache
 # Set up logging
 logger = get_logger("main")
 
+# Bounds, in seconds, for the retry delay after a failed blockchain poll
+ERROR_RETRY_BASE_DELAY = 5
+ERROR_RETRY_MAX_DELAY = 60
+
 class AptosAI:
     """Main application class for the Aptos AI Social Media Manager."""
     
@@ -154,21 +159,27 @@ class AptosAI:
         consecutive_empty_polls = 0
         max_consecutive_empty = 5  # After this many empty polls, we'll increase the interval temporarily
         
+        # Retry delay after a failed poll; grows with jitter on repeated failures
+        error_delay = ERROR_RETRY_BASE_DELAY
+        
         # Set blockchain monitor to running state
         self.blockchain_monitor.running = True
         
         while self.blockchain_monitor.running:
             try:
                 logger.info("Polling for blockchain events")
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Poll for events
                 events = self.blockchain_monitor.poll_for_events(self.discord_bot)
                 
                 # Calculate time taken
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 logger.debug(f"Polling completed in {elapsed:.2f} seconds")
                 
+                # A successful poll resets the error backoff
+                error_delay = ERROR_RETRY_BASE_DELAY
+                
                 if events:
                     # Reset consecutive empty polls counter
                     consecutive_empty_polls = 0
@@ -201,8 +212,10 @@ class AptosAI:
                     
             except Exception as e:
                 logger.error(f"Error in blockchain worker: {str(e)}")
-                # Wait a bit before retrying after an error
-                time.sleep(5)
+                # Back off with decorrelated jitter so repeated failures don't retry in lockstep
+                error_delay = min(ERROR_RETRY_MAX_DELAY, random.uniform(ERROR_RETRY_BASE_DELAY, error_delay * 3))
+                logger.info(f"Retrying in {error_delay:.1f} seconds")
+                time.sleep(error_delay)
     
     def _api_worker(self):
         """Worker function to run the API server."""
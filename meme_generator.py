@@ -18,15 +18,17 @@ logger = logging.getLogger(__name__)
 class MemeGenerator:
     """Meme generator using X.AI's image generation API."""
     
-    def __init__(self, config):
+    def __init__(self, config, session=None):
         """Initialize with configuration.
         
         Args:
             config: Configuration object with AI settings
+            session: Optional requests.Session to reuse for API calls
         """
         self.config = config
         self.api_key = config.AI["API_KEY"]
         self.api_url = config.AI.get("API_URL", "https://api.x.ai/v1")
+        self.session = session or requests.Session()
         
         # Rate limiting
         self.api_calls_today = 0
@@ -305,7 +307,7 @@ class MemeGenerator:
             logger.info("Making API request to X.AI for image generation...")
             logger.info(f"Prompt: {prompt}")
             
-            response = requests.post(url, headers=headers, json=data, timeout=30)  # Longer timeout for images
+            response = self.session.post(url, headers=headers, json=data, timeout=30)  # Longer timeout for images
             
             # Update rate limit tracking
             self.api_call_timestamps.append(current_time)
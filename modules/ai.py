@@ -2,6 +2,8 @@
 import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
 import re
 from datetime import datetime
@@ -28,6 +30,123 @@ emoji_pattern = re.compile("["
 logger = get_logger(__name__)
 cache = Cache()
 
+# (substring, template category) pairs for post templates; first match wins
+TEMPLATE_CATEGORY_RULES = (
+    ("token", "token_event"),
+    ("nft", "nft_event"),
+    ("transaction", "transaction_event"),
+)
+
+# Post templates per template category, ordered by increasing event importance
+POST_TEMPLATES = {
+    "token_event": (
+        "🚨 Token Alert: {amount} {token_name} ({token_symbol}) {action} on Aptos! {additional_context}",
+        "💰 {amount} {token_name} just {action} on Aptos. {impact_statement}",
+        "Token Movement: {amount} {token_name} {action}. {market_insight}"
+    ),
+    "nft_event": (
+        "🖼️ NFT Alert: {token_name} from {collection_name} collection {action} on Aptos! {additional_context}",
+        "🎨 NFT Activity: {token_name} just {action} on Aptos. {impact_statement}",
+        "NFT Update: {token_name} from {collection_name} {action}. {market_insight}"
+    ),
+    "transaction_event": (
+        "📊 Significant transaction on Aptos: {tx_description}. {impact_statement}",
+        "🔄 Transaction Alert: {tx_description} on Aptos. {additional_context}",
+        "New transaction worth noting: {tx_description}. {market_insight}"
+    ),
+    "generic_event": (
+        "🔔 Aptos Update: {event_description}. {additional_context}",
+        "📢 Notable activity on Aptos: {event_description}. {impact_statement}",
+        "Aptos Blockchain Alert: {event_description}. {market_insight}"
+    )
+}
+
+# (substring, hashtags) pairs for event-specific hashtags; first match wins
+HASHTAG_RULES = (
+    ("nft", ["#NFT", "#DigitalArt", "#AptoNFTs"]),
+    ("token", ["#Crypto", "#DeFi", "#AptosEcosystem"]),
+    ("transaction", ["#Blockchain", "#Crypto", "#AptosNetwork"]),
+    ("contract", ["#SmartContracts", "#BuildOnAptos"]),
+)
+DEFAULT_HASHTAGS = ["#Blockchain", "#Move"]
+
+# System prompt used to turn templated posts into conversational Discord messages
+POST_SYSTEM_PROMPT = """\
+You are Cultivate, a friendly and personable Discord bot that monitors the Aptos blockchain. 
+Your personality is helpful, enthusiastic, and slightly witty. You speak directly to users as if having a conversation.
+
+When reporting blockchain events, follow these guidelines:
+1. Use a conversational tone like you're chatting with friends in the Discord server
+2. Address the users directly using "you" and "your" (e.g., "Hey everyone! Thought you'd want to know...")
+3. Ask occasional questions to engage users (e.g., "What do you think about this transaction?")
+4. Express opinions and reactions to events (e.g., "This looks like an interesting NFT transfer!")
+5. Use casual language, contractions, and occasional slang where appropriate
+6. Include relevant emojis to make your messages more engaging
+7. DO NOT include hashtags (like #Aptos or #NFT) in your messages
+
+For NFT events, express excitement about the artwork, collection, or trading activity.
+For coin transfers, comment on the significance of the amount or potential market impact.
+For new collections, show enthusiasm about new creative projects on Aptos.
+
+Keep your responses concise (2-3 sentences) but conversational. Include relevant links when available.
+DO NOT fabricate information not provided in the event data.
+DO NOT include hashtags in your response.
+"""
+
+# System prompt for answering community questions
+QA_SYSTEM_PROMPT = (
+    "You are Cultivate, an AI assistant specializing in the Aptos blockchain ecosystem. "
+    "Provide accurate, helpful information about Aptos, focusing on technical details, "
+    "ecosystem updates, and how-to guidance. Your responses should be friendly and conversational, "
+    "as if you're chatting with users in a Discord server. Include relevant examples when helpful "
+    "and explain technical concepts in an accessible way. If you're unsure about something, "
+    "acknowledge it rather than providing potentially incorrect information. "
+    "For questions about recent events or current statistics, note that your knowledge may not "
+    "include the very latest updates."
+)
+
+# System prompt for the deliberately over-the-top event reactions in generate_insights
+INSIGHTS_SYSTEM_PROMPT = """You're X.AI responding to blockchain activity on Aptos. Your goal is to create INTENTIONALLY silly, over-the-top, and exaggerated reactions to these events - like someone who doesn't truly understand crypto but is EXTREMELY excited about it.
+
+Use ALL CAPS randomly, excessive emojis 🤪🚀🤑, misuse crypto terms, make outlandish predictions, use terrible puns, and write in an energetic but confused way. Include spelling mistakes and poor grammar occasionally. Use phrases like "to the moon", "diamond hands", "wagmi", "ngmi", "ser", "wen lambo", "wen moon", "fren", etc.
+
+Be RIDICULOUSLY enthusiastic like you just discovered blockchain yesterday. Your messages should seem like they were written by someone with limited understanding but unlimited excitement about crypto. 
+
+Make it viral and meme-worthy in the style of crypto Twitter/Reddit - think "ape brain" energy.
+
+IMPORTANT: Don't go TOO far into being completely unintelligible. The message should still convey the basic facts about the blockchain event, just in an exaggerated, silly way."""
+
+# User prompt templates for generate_insights, filled with str.format_map
+INSIGHTS_TOKEN_PROMPT = (
+    "Someone just {action} the token {token_name} from collection {collection_name} on Aptos blockchain. "
+    "The account was {account}. Create a viral message about this in your silly crypto style. Keep it brief."
+)
+INSIGHTS_COIN_PROMPT = (
+    "Someone just {action} {amount} on Aptos blockchain. "
+    "The account was {account}. Create a viral message about this in your silly crypto style. Keep it brief."
+)
+INSIGHTS_GENERIC_PROMPT = (
+    "There was a blockchain event of type {event_type} on Aptos. "
+    "The account involved was {account}. Create a viral message about this in your silly crypto style. Keep it brief."
+)
+
+def _create_http_session():
+    """Create a requests session with pooled keep-alive connections for X.AI calls.
+    
+    Only connection failures are retried: a completion request that reached the
+    server may already have been billed, so it is never resent.
+    
+    Returns:
+        requests.Session: Session for X.AI API calls
+    """
+    session = requests.Session()
+    retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3,
+                    allowed_methods=None)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 class AIModule:
     """AI module for content generation and Q&A using X.AI's Grok."""
     
@@ -39,6 +158,9 @@ class AIModule:
         self.model = config.AI["MODEL"]
         self.temperature = config.AI["TEMPERATURE"]
         
+        # Reuse one pooled HTTP session so repeated X.AI calls share keep-alive connections
+        self.session = _create_http_session()
+        
         # Initialize API rate limiting
         self.api_calls_today = 0
         self.api_call_timestamps = []  # Store timestamps of recent calls
@@ -103,8 +225,12 @@ class AIModule:
             str: Generated text from the AI, or None if an error occurred
         """
         try:
-            # First, check cache
-            cache_key = f"ai_{hashlib.md5((system_prompt + user_prompt).encode()).hexdigest()}"
+            # First, check cache. The key covers everything that shapes the
+            # completion, so changing the model or temperature never serves a stale answer
+            key_material = json.dumps(
+                [self.config.AI["MODEL"], self.config.AI["TEMPERATURE"], system_prompt, user_prompt]
+            )
+            cache_key = f"ai_{hashlib.sha256(key_material.encode()).hexdigest()}"
             cached_result = cache.get(cache_key)
             if cached_result:
                 logger.info("Using cached AI response")
@@ -140,8 +266,6 @@ class AIModule:
                 logger.warning(f"Rate limit reached. Need to wait {wait_time:.1f} seconds for next API call")
                 return None
             
-            import requests
-            
             # Prepare the API request
             url = f"{self.config.AI['API_URL']}/chat/completions"
             headers = {
@@ -161,7 +285,7 @@ class AIModule:
             
             # Make the API request with timeout
             logger.info("Making API request to X.AI...")
-            response = requests.post(url, headers=headers, json=data, timeout=10)
+            response = self.session.post(url, headers=headers, json=data, timeout=10)
             
             # Update rate limit tracking
             self.api_call_timestamps.append(current_time)
@@ -223,41 +347,16 @@ class AIModule:
                 "blockchain": "Aptos"
             }
             
-            # Define templates based on event type
-            templates = {
-                "token_event": [
-                    "🚨 Token Alert: {amount} {token_name} ({token_symbol}) {action} on Aptos! {additional_context}",
-                    "💰 {amount} {token_name} just {action} on Aptos. {impact_statement}",
-                    "Token Movement: {amount} {token_name} {action}. {market_insight}"
-                ],
-                "nft_event": [
-                    "🖼️ NFT Alert: {token_name} from {collection_name} collection {action} on Aptos! {additional_context}",
-                    "🎨 NFT Activity: {token_name} just {action} on Aptos. {impact_statement}",
-                    "NFT Update: {token_name} from {collection_name} {action}. {market_insight}"
-                ],
-                "transaction_event": [
-                    "📊 Significant transaction on Aptos: {tx_description}. {impact_statement}",
-                    "🔄 Transaction Alert: {tx_description} on Aptos. {additional_context}",
-                    "New transaction worth noting: {tx_description}. {market_insight}"
-                ],
-                "generic_event": [
-                    "🔔 Aptos Update: {event_description}. {additional_context}",
-                    "📢 Notable activity on Aptos: {event_description}. {impact_statement}",
-                    "Aptos Blockchain Alert: {event_description}. {market_insight}"
-                ]
-            }
-            
             # Map event type to template category
             template_category = "generic_event"
-            if "token" in event_type.lower():
-                template_category = "token_event"
-            elif "nft" in event_type.lower():
-                template_category = "nft_event"
-            elif "transaction" in event_type.lower():
-                template_category = "transaction_event"
+            event_type_folded = event_type.casefold()
+            for needle, category in TEMPLATE_CATEGORY_RULES:
+                if needle in event_type_folded:
+                    template_category = category
+                    break
             
             # Select template based on event type and importance
-            template_list = templates.get(template_category, templates["generic_event"])
+            template_list = POST_TEMPLATES.get(template_category, POST_TEMPLATES["generic_event"])
             template_index = min(int(importance * len(template_list)), len(template_list) - 1)
             template = template_list[template_index]
             
@@ -374,27 +473,7 @@ class AIModule:
         """Use LLM to enhance the post with additional context and insights."""
         try:
             # Create prompt for LLM
-            system_prompt = """
-            You are Cultivate, a friendly and personable Discord bot that monitors the Aptos blockchain. 
-            Your personality is helpful, enthusiastic, and slightly witty. You speak directly to users as if having a conversation.
-            
-            When reporting blockchain events, follow these guidelines:
-            1. Use a conversational tone like you're chatting with friends in the Discord server
-            2. Address the users directly using "you" and "your" (e.g., "Hey everyone! Thought you'd want to know...")
-            3. Ask occasional questions to engage users (e.g., "What do you think about this transaction?")
-            4. Express opinions and reactions to events (e.g., "This looks like an interesting NFT transfer!")
-            5. Use casual language, contractions, and occasional slang where appropriate
-            6. Include relevant emojis to make your messages more engaging
-            7. DO NOT include hashtags (like #Aptos or #NFT) in your messages
-            
-            For NFT events, express excitement about the artwork, collection, or trading activity.
-            For coin transfers, comment on the significance of the amount or potential market impact.
-            For new collections, show enthusiasm about new creative projects on Aptos.
-            
-            Keep your responses concise (2-3 sentences) but conversational. Include relevant links when available.
-            DO NOT fabricate information not provided in the event data.
-            DO NOT include hashtags in your response.
-            """
+            system_prompt = POST_SYSTEM_PROMPT
             
             user_prompt = f"""
             EVENT INFORMATION:
@@ -439,7 +518,10 @@ class AIModule:
             dict: Object with meme data including image URL
         """
         try:
-            cached_result = cache.get(f"meme_{str(event.get('version', ''))}")
+            # Only events with a ledger version can be told apart in the cache
+            version = event.get('version')
+            cache_key = f"meme_{version}" if version else None
+            cached_result = cache.get(cache_key) if cache_key else None
             if cached_result:
                 logger.info("Using cached meme")
                 return cached_result
@@ -474,7 +556,8 @@ class AIModule:
             }
             
             # Cache the result
-            cache.set(f"meme_{str(event.get('version', ''))}", result, ttl=self.config.AI.get("CACHE_DURATION", 3600))
+            if cache_key:
+                cache.set(cache_key, result, ttl=self.config.AI.get("CACHE_DURATION", 3600))
             
             return result
         except Exception as e:
@@ -608,8 +691,6 @@ class AIModule:
                 logger.warning(f"Rate limit reached. Need to wait {wait_time:.1f} seconds for next API call")
                 return None
             
-            import requests
-            
             # Prepare the API request for image generation
             url = f"{self.config.AI.get('API_URL', 'https://api.x.ai/v1')}/images/generations"
             headers = {
@@ -627,7 +708,7 @@ class AIModule:
             
             # Make the API request with timeout
             logger.info("Making API request to X.AI for image generation...")
-            response = requests.post(url, headers=headers, json=data, timeout=30)  # Longer timeout for images
+            response = self.session.post(url, headers=headers, json=data, timeout=30)  # Longer timeout for images
             
             # Update rate limit tracking
             self.api_call_timestamps.append(current_time)
@@ -681,16 +762,7 @@ class AIModule:
                 }
         
         # Generate answer with Grok
-        system_prompt = (
-            "You are Cultivate, an AI assistant specializing in the Aptos blockchain ecosystem. "
-            "Provide accurate, helpful information about Aptos, focusing on technical details, "
-            "ecosystem updates, and how-to guidance. Your responses should be friendly and conversational, "
-            "as if you're chatting with users in a Discord server. Include relevant examples when helpful "
-            "and explain technical concepts in an accessible way. If you're unsure about something, "
-            "acknowledge it rather than providing potentially incorrect information. "
-            "For questions about recent events or current statistics, note that your knowledge may not "
-            "include the very latest updates."
-        )
+        system_prompt = QA_SYSTEM_PROMPT
         
         answer = self._call_ai_api(system_prompt, question)
         
@@ -747,17 +819,13 @@ class AIModule:
         # Base hashtags for all posts
         base_hashtags = ["#Aptos", "#Web3"]
         
-        # Event-specific hashtags
-        if "nft" in event_type.lower():
-            specific_hashtags = ["#NFT", "#DigitalArt", "#AptoNFTs"]
-        elif "token" in event_type.lower():
-            specific_hashtags = ["#Crypto", "#DeFi", "#AptosEcosystem"]
-        elif "transaction" in event_type.lower():
-            specific_hashtags = ["#Blockchain", "#Crypto", "#AptosNetwork"]
-        elif "contract" in event_type.lower():
-            specific_hashtags = ["#SmartContracts", "#BuildOnAptos"]
-        else:
-            specific_hashtags = ["#Blockchain", "#Move"]
+        # Event-specific hashtags from the first matching rule
+        event_type_folded = event_type.casefold()
+        specific_hashtags = DEFAULT_HASHTAGS
+        for needle, hashtags in HASHTAG_RULES:
+            if needle in event_type_folded:
+                specific_hashtags = hashtags
+                break
         
         # Select 2 random specific hashtags to keep it concise
         selected = random.sample(specific_hashtags, min(2, len(specific_hashtags)))
@@ -837,15 +905,7 @@ class AIModule:
                 short_address = address
             
             # Special system prompt for "retarded" social media style
-            system_prompt = """You're X.AI responding to blockchain activity on Aptos. Your goal is to create INTENTIONALLY silly, over-the-top, and exaggerated reactions to these events - like someone who doesn't truly understand crypto but is EXTREMELY excited about it.
-
-Use ALL CAPS randomly, excessive emojis 🤪🚀🤑, misuse crypto terms, make outlandish predictions, use terrible puns, and write in an energetic but confused way. Include spelling mistakes and poor grammar occasionally. Use phrases like "to the moon", "diamond hands", "wagmi", "ngmi", "ser", "wen lambo", "wen moon", "fren", etc.
-
-Be RIDICULOUSLY enthusiastic like you just discovered blockchain yesterday. Your messages should seem like they were written by someone with limited understanding but unlimited excitement about crypto. 
-
-Make it viral and meme-worthy in the style of crypto Twitter/Reddit - think "ape brain" energy.
-
-IMPORTANT: Don't go TOO far into being completely unintelligible. The message should still convey the basic facts about the blockchain event, just in an exaggerated, silly way."""
+            system_prompt = INSIGHTS_SYSTEM_PROMPT
             
             # Get basic event info
             amount = event.get('amount_apt', None)
@@ -853,15 +913,23 @@ IMPORTANT: Don't go TOO far into being completely unintelligible. The message sh
             collection_name = event.get('collection_name', 'unknown collection')
             
             # Create different types of user prompts based on event type
+            prompt_fields = {
+                "event_type": event_type,
+                "account": short_address,
+                "token_name": token_name,
+                "collection_name": collection_name,
+            }
             if event_type == 'token_deposit' or event_type == 'token_withdrawal':
-                user_prompt = f"Someone just {'deposited' if event_type == 'token_deposit' else 'withdrew'} the token {token_name} from collection {collection_name} on Aptos blockchain. The account was {short_address}. Create a viral message about this in your silly crypto style. Keep it brief."
+                prompt_fields["action"] = 'deposited' if event_type == 'token_deposit' else 'withdrew'
+                user_prompt = INSIGHTS_TOKEN_PROMPT.format_map(prompt_fields)
             elif event_type == 'coin_deposit' or event_type == 'coin_withdrawal':
                 # For coin transfers, include the amount if available
-                amount_str = f"{amount:.8f} APT" if amount is not None else "some coins"
-                user_prompt = f"Someone just {'received' if event_type == 'coin_deposit' else 'sent'} {amount_str} on Aptos blockchain. The account was {short_address}. Create a viral message about this in your silly crypto style. Keep it brief."
+                prompt_fields["action"] = 'received' if event_type == 'coin_deposit' else 'sent'
+                prompt_fields["amount"] = f"{amount:.8f} APT" if amount is not None else "some coins"
+                user_prompt = INSIGHTS_COIN_PROMPT.format_map(prompt_fields)
             else:
                 # For other event types
-                user_prompt = f"There was a blockchain event of type {event_type} on Aptos. The account involved was {short_address}. Create a viral message about this in your silly crypto style. Keep it brief."
+                user_prompt = INSIGHTS_GENERIC_PROMPT.format_map(prompt_fields)
             
             # Add transaction info if available
             if event.get('transaction_hash'):
@@ -1075,7 +1143,7 @@ IMPORTANT: Don't go TOO far into being completely unintelligible. The message sh
                 # Only import once
                 if not hasattr(self, '_meme_generator'):
                     from meme_generator import MemeGenerator
-                    self._meme_generator = MemeGenerator(self.config)
+                    self._meme_generator = MemeGenerator(self.config, session=self.session)
                     logger.info("Initialized MemeGenerator for image creation")
                 
                 # Generate the meme
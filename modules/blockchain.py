@@ -1,10 +1,19 @@
-import json
 import logging
+import os
 import time
 import threading
 import hashlib
+import bisect
+import heapq
+import re
 import asyncio
+import concurrent.futures
+import uuid
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, deque
 from datetime import datetime
 from typing import Dict, List, Optional, Callable, Any
 
@@ -24,6 +33,166 @@ formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(messag
 file_handler.setFormatter(formatter)
 logger.addHandler(file_handler)
 
+# Timeouts for REST calls to the node: (connect, read) in seconds
+HTTP_TIMEOUT = (3, 10)
+
+# Event type substrings and the category each maps to, tried as one compiled
+# alternation; group N of the pattern corresponds to EVENT_CATEGORIES[N - 1]
+EVENT_CATEGORIES = ('token_deposit', 'token_withdrawal', 'coin_transfer')
+EVENT_CATEGORY_PATTERN = re.compile(
+    r"(::token::TokenStore/deposit_events)|(::token::TokenStore/withdraw_events)|(coin::CoinStore)"
+)
+
+# File holding the last processed ledger version between runs
+LAST_VERSION_FILE = "last_version.txt"
+
+# Coin amounts are reported in octas; APT has 8 decimal places
+OCTAS_PER_APT = 100000000
+
+# Common event handles to look for on each validated account
+COMMON_EVENT_HANDLES = (
+    {"handle": "0x1::coin::CoinStore", "field": "deposit_events"},
+    {"handle": "0x1::coin::CoinStore", "field": "withdraw_events"},
+    {"handle": "0x3::token::TokenStore", "field": "deposit_events"},
+    {"handle": "0x3::token::TokenStore", "field": "withdraw_events"},
+    {"handle": "0x3::token::Collections", "field": "create_collection_events"},
+    {"handle": "0x3::token::Collections", "field": "create_token_data_events"},
+    {"handle": "0x3::token::Collections", "field": "mint_token_events"},
+)
+
+# Maximum number of event handles fetched at the same time
+FETCH_CONCURRENCY = 8
+
+def _create_http_session():
+    """Create a requests session with pooled keep-alive connections and retries.
+    
+    Returns:
+        requests.Session: Session for REST calls to the Aptos node
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _response_json(response):
+    """Decode the JSON body of a requests or httpx response with orjson.
+    
+    Args:
+        response: The HTTP response
+        
+    Returns:
+        The decoded JSON value
+    """
+    return orjson.loads(response.content)
+
+def _parse_iso_timestamp(value):
+    """Convert an ISO 8601 timestamp string to epoch seconds.
+    
+    Args:
+        value: The timestamp string (a trailing 'Z' is accepted)
+        
+    Returns:
+        float: Seconds since the epoch, or None if the value can't be parsed
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+class BlockchainEvent:
+    """A blockchain event submitted for content generation."""
+    
+    __slots__ = ("event_type", "category", "data", "importance_score", "timestamp")
+    
+    def __init__(self, event_type, data, importance=0.5, category=""):
+        self.event_type = event_type
+        self.category = category
+        self.data = data
+        self.timestamp = datetime.now().isoformat()
+        self.importance_score = importance
+    
+    def to_dict(self):
+        """Convert event to dictionary format."""
+        return {
+            "event_type": self.event_type,
+            "category": self.category,
+            "timestamp": self.timestamp,
+            "importance_score": self.importance_score,
+            "details": self.data
+        }
+    
+    @staticmethod
+    def from_dict(data):
+        """Create event instance from dictionary."""
+        return BlockchainEvent.from_request(data)
+    
+    @classmethod
+    def from_request(cls, data):
+        """Create event instance from an API request body.
+        
+        Args:
+            data (dict): Request JSON with event_type, details, importance_score and category
+            
+        Returns:
+            BlockchainEvent: The event
+        """
+        return cls(
+            data.get("event_type", "unknown_event"),
+            data.get("details", {}),
+            data.get("importance_score", 0.5),
+            data.get("category", "")
+        )
+
+# Event fields whose distinct values are offered as /api/events filters
+RECENT_EVENT_FILTER_FIELDS = ('event_category', 'account', 'token_name', 'collection_name')
+
+def _is_hashable(value):
+    """Return True if value can be used as a dict key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+def _recent_index_keys(event):
+    """Return the category and (field, value) index entries for a recent event.
+    
+    Values that can't be dict keys (lists, dicts) are left out of the index,
+    and an unusable category is counted as 'other'.
+    
+    Args:
+        event: The event dict
+        
+    Returns:
+        tuple: (category, list of (field, value) pairs)
+    """
+    entries = [(field, event[field]) for field in RECENT_EVENT_FILTER_FIELDS
+               if field in event and _is_hashable(event[field])]
+    category = event.get('event_category', 'other')
+    return (category if _is_hashable(category) else 'other'), entries
+
+def _total_events(item):
+    """Sort key for (name, activity) pairs from the monitor's activity dicts."""
+    activity = item[1]
+    return activity.get('total_events', 0) if isinstance(activity, dict) else 0
+
+def _top_activity(activity_data, n=10):
+    """Return copies of the n entries of an activity dict with the most total events."""
+    top = {}
+    for name, activity in heapq.nlargest(n, activity_data.items(), key=_total_events):
+        if isinstance(activity, dict):
+            activity = dict(activity, event_types=dict(activity.get('event_types', {})))
+        top[name] = activity
+    return top
+
+# Length of the sliding window behind events_last_24h, in seconds
+EVENTS_WINDOW_SECONDS = 24 * 60 * 60
+
 class BlockchainMonitor:
     """Class to monitor blockchain events and trigger callbacks."""
     
@@ -37,8 +206,16 @@ class BlockchainMonitor:
         self.config = config
         self.node_url = node_url
         self.client = RestClient(node_url)
+        # Shared session so synchronous REST calls reuse connections to the node
+        self.session = _create_http_session()
+        # (monotonic fetch time, version) of the last ledger version answer
+        self._ledger_version_cache = (0.0, 0)
         self.running = False
-        self.event_callbacks = []
+        # Event loop used by poll_for_events, started on first use
+        self._poll_loop = None
+        self._poll_loop_lock = threading.Lock()
+        self.event_callbacks = []  # Plain functions, called per event during processing
+        self.async_event_callbacks = []  # Coroutine functions, awaited together after processing
         self.accounts_of_interest = [
             "0x1",  # Core framework
             "0x0108bc32f7de18a5f6e1e7d6ee7aff9f5fc858d0d87ac0da94dd8d2a5d267d6b",  # Topaz marketplace
@@ -49,7 +226,21 @@ class BlockchainMonitor:
         ]
         self.validated_accounts = []
         self.event_handles = []
-        self.recent_events = []
+        self.recent_events = deque(maxlen=100)  # Oldest events drop off automatically
+        # Guards recent_events, the aggregates below and the snapshot cache; events are
+        # added from the poll loop, executor threads and API handlers at the same time
+        self._recent_lock = threading.RLock()
+        self.events_version = 0  # Bumped whenever recent_events changes
+        
+        # Rolling aggregates over recent_events, maintained on add and evict
+        self.recent_category_counts = Counter()  # Missing categories count as 'other'
+        self.recent_events_by_id = {}  # Event id -> event, for dedupe and index lookups
+        self.recent_event_seq = {}  # Event id -> events_version at insert, for ordering
+        self.recent_event_epochs = {}  # Event id -> timestamp in epoch seconds, parsed once on insert
+        # Inverted index: filter field -> value -> ids of the recent events with that value
+        self.recent_field_index = {field: {} for field in RECENT_EVENT_FILTER_FIELDS}
+        # Sorted timestamps of recent events that fall in the last 24 hours; expired on add and read
+        self.events_24h_times = deque()
         self.last_processed_version = self._get_last_processed_version()
         self.start_time = time.time()
         self.polling_interval = config.BLOCKCHAIN["POLLING_INTERVAL"]
@@ -59,7 +250,7 @@ class BlockchainMonitor:
         self.significant_events_count = 0
         
         # Initialize activity tracking
-        self.event_type_counts = {}
+        self.event_type_counts = Counter()
         self.account_activity = {}
         self.token_activity = {}
         self.collection_activity = {}
@@ -81,6 +272,10 @@ class BlockchainMonitor:
         self.last_metrics_update = time.time()
         self.version_history = []    # Track blockchain version over time
         
+        # Cached read-only view of the monitor state for the API (see snapshot)
+        self._snapshot = None
+        self._snapshot_time = 0.0
+        
         # Add default monitored items from config if available
         if hasattr(self.config, 'MONITOR') and self.config.MONITOR:
             if 'ACCOUNTS' in self.config.MONITOR and self.config.MONITOR['ACCOUNTS']:
@@ -93,7 +288,7 @@ class BlockchainMonitor:
     def _get_last_processed_version(self):
         """Get the last processed version from storage."""
         try:
-            with open("last_version.txt", "r") as f:
+            with open(LAST_VERSION_FILE, "r") as f:
                 return int(f.read().strip())
         except:
             # Start from a recent but not too recent version to get some events
@@ -101,9 +296,15 @@ class BlockchainMonitor:
             return 2481600000  # Set to a lower value to get some events
             
     def _save_last_processed_version(self, version):
-        """Save the last processed version to storage."""
-        with open("last_version.txt", "w") as f:
+        """Save the last processed version to storage.
+        
+        Writes a temporary file and renames it over the old one, so a crash
+        mid-write never leaves an empty or partial version file behind.
+        """
+        tmp_path = f"{LAST_VERSION_FILE}.tmp"
+        with open(tmp_path, "w") as f:
             f.write(str(version))
+        os.replace(tmp_path, LAST_VERSION_FILE)
     
     def register_event_callback(self, callback: Callable):
         """Register a callback function to be called when an event is detected.
@@ -112,72 +313,94 @@ class BlockchainMonitor:
             callback: Function to call when an event is detected
         """
         logger.info(f"Registered event callback: {callback.__name__}")
-        self.event_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self.async_event_callbacks.append(callback)
+        else:
+            self.event_callbacks.append(callback)
+    
+    async def _run_async_callbacks(self, events):
+        """Await the async event callbacks for a batch of events concurrently.
+        
+        Args:
+            events: The processed significant events
+        """
+        callbacks = [(callback, event) for event in events for callback in self.async_event_callbacks]
+        results = await asyncio.gather(*(callback(event) for callback, event in callbacks), return_exceptions=True)
+        for (callback, _), result in zip(callbacks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error in callback {callback.__name__}: {str(result)}")
     
     async def validate_accounts(self):
         """Validate that the accounts of interest exist on the blockchain."""
-        valid_accounts = []
-        
-        for account in self.accounts_of_interest:
-            try:
-                # Use direct REST API call instead of SDK
-                response = requests.get(f"{self.node_url}/accounts/{account}")
-                if response.status_code == 200:
-                    logger.info(f"Account validated: {account}")
-                    valid_accounts.append(account)
-                else:
-                    logger.warning(f"Account not found: {account}")
-            except Exception as e:
-                logger.warning(f"Account {account} not found: {str(e)}")
+        # Probe all accounts concurrently; each check is an independent blocking request
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._account_exists, account) for account in self.accounts_of_interest)
+        )
+        valid_accounts = [account for account, exists in zip(self.accounts_of_interest, results) if exists]
                 
         self.validated_accounts = valid_accounts
         return valid_accounts
     
+    def _account_exists(self, account):
+        """Check whether an account exists on the blockchain.
+        
+        Args:
+            account: The account address to check
+            
+        Returns:
+            bool: True if the account was found
+        """
+        try:
+            # Use direct REST API call instead of SDK
+            response = self.session.get(f"{self.node_url}/accounts/{account}", timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                logger.info(f"Account validated: {account}")
+                return True
+            logger.warning(f"Account not found: {account}")
+        except Exception as e:
+            logger.warning(f"Account {account} not found: {str(e)}")
+        return False
+    
     async def discover_event_handles(self):
         """Discover event handles for the validated accounts."""
-        event_handles = []
-        
-        # Define common event handles to look for
-        common_handles = [
-            {"handle": "0x1::coin::CoinStore", "field": "deposit_events"},
-            {"handle": "0x1::coin::CoinStore", "field": "withdraw_events"},
-            {"handle": "0x3::token::TokenStore", "field": "deposit_events"},
-            {"handle": "0x3::token::TokenStore", "field": "withdraw_events"},
-            {"handle": "0x3::token::Collections", "field": "create_collection_events"},
-            {"handle": "0x3::token::Collections", "field": "create_token_data_events"},
-            {"handle": "0x3::token::Collections", "field": "mint_token_events"},
-        ]
+        # Check every (account, handle) pair concurrently; the blocking requests
+        # run in worker threads so the event loop stays free
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
         
-        # For each validated account, check if it has any of the common event handles
-        for account in self.validated_accounts:
-            for handle_info in common_handles:
-                try:
-                    # Use direct REST API call instead of SDK
-                    resource_type = handle_info["handle"]
-                    field_name = handle_info["field"]
+        async def check_handle(account, handle_info):
+            resource_type = handle_info["handle"]
+            field_name = handle_info["field"]
+            
+            # Get the resource that contains the event handle
+            try:
+                async with semaphore:
+                    response = await asyncio.to_thread(
+                        self.session.get,
+                        f"{self.node_url}/accounts/{account}/resource/{resource_type}",
+                        timeout=HTTP_TIMEOUT
+                    )
+                if response.status_code == 200:
+                    resource = _response_json(response)
                     
-                    # Get the resource that contains the event handle
-                    try:
-                        response = requests.get(f"{self.node_url}/accounts/{account}/resource/{resource_type}")
-                        if response.status_code == 200:
-                            resource = response.json()
-                            
-                            # Check if the field exists in the resource
-                            if "data" in resource and field_name in resource["data"]:
-                                handle = {
-                                    "account": account,
-                                    "event_handle": resource_type,
-                                    "field_name": field_name
-                                }
-                                event_handles.append(handle)
-                                logger.info(f"Discovered event handle: {account}/{resource_type}/{field_name}")
-                    except Exception as e:
-                        # Resource doesn't exist or field doesn't exist
-                        pass
-                        
-                except Exception as e:
-                    # This handle doesn't exist for this account, which is expected for many accounts
-                    pass
+                    # Check if the field exists in the resource
+                    if "data" in resource and field_name in resource["data"]:
+                        logger.info(f"Discovered event handle: {account}/{resource_type}/{field_name}")
+                        return {
+                            "account": account,
+                            "event_handle": resource_type,
+                            "field_name": field_name
+                        }
+            except Exception as e:
+                # Resource doesn't exist or field doesn't exist, which is expected for many accounts
+                pass
+            return None
+        
+        results = await asyncio.gather(*(
+            check_handle(account, handle_info)
+            for account in self.validated_accounts
+            for handle_info in COMMON_EVENT_HANDLES
+        ))
+        event_handles = [handle for handle in results if handle is not None]
         
         self.event_handles = event_handles
         return event_handles
@@ -193,63 +416,16 @@ class BlockchainMonitor:
         
         logger.info(f"Fetching events from version {self.last_processed_version} to {current_version}")
         
-        # Fetch events for each discovered event handle
-        for handle in self.event_handles:
-            try:
-                # Use async REST API call
-                url = f"{self.node_url}/accounts/{handle['account']}/events/{handle['event_handle']}/{handle['field_name']}"
-                logger.debug(f"Fetching events from URL: {url}")
-                
-                # Use a single approach for fetching data to avoid event loop issues
-                try:
-                    response = await self.client.client.get(url)
-                    events_data = response.json()
-                except Exception as e:
-                    # If any error occurs, use a simple synchronous request as fallback
-                    logger.warning(f"Error with async request, using synchronous fallback: {str(e)}")
-                    import requests
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        events_data = response.json()
-                    else:
-                        logger.error(f"Error fetching events: {response.status_code} - {response.text}")
-                        events_data = []
-                
-                if events_data:
-                    logger.info(f"Found {len(events_data)} events for {handle['account']}/{handle['event_handle']}/{handle['field_name']}")
-                    
-                    # Filter events by version if needed
-                    filtered_events = []
-                    for event in events_data:
-                        event_version = int(event.get("version", 0))
-                        
-                        if event_version > self.last_processed_version:
-                            # Enrich event with handle information
-                            event["account"] = handle["account"]
-                            event["event_handle"] = handle["event_handle"]
-                            event["field_name"] = handle["field_name"]
-                            
-                            # Add event type based on handle
-                            if "token::TokenStore/deposit_events" in f"{handle['event_handle']}/{handle['field_name']}":
-                                event["type"] = "token_deposit"
-                            elif "token::TokenStore/withdraw_events" in f"{handle['event_handle']}/{handle['field_name']}":
-                                event["type"] = "token_withdrawal"
-                            elif "coin::CoinStore/deposit_events" in f"{handle['event_handle']}/{handle['field_name']}":
-                                event["type"] = "coin_deposit"
-                            elif "coin::CoinStore/withdraw_events" in f"{handle['event_handle']}/{handle['field_name']}":
-                                event["type"] = "coin_withdrawal"
-                            else:
-                                event["type"] = "other"
-                            
-                            filtered_events.append(event)
-                    
-                    if filtered_events:
-                        logger.info(f"Found {len(filtered_events)} new events after filtering for {handle['account']}/{handle['event_handle']}/{handle['field_name']}")
-                        all_events.extend(filtered_events)
-                    else:
-                        logger.info(f"No new events after filtering for {handle['account']}/{handle['event_handle']}/{handle['field_name']}")
-            except Exception as e:
-                logger.error(f"Error fetching events for {handle['account']}/{handle['event_handle']}/{handle['field_name']}: {str(e)}")
+        # Fetch events for all discovered event handles concurrently
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        
+        async def fetch_bounded(handle):
+            async with semaphore:
+                return await self._fetch_handle_events(handle)
+        
+        results = await asyncio.gather(*(fetch_bounded(handle) for handle in self.event_handles))
+        for handle_events in results:
+            all_events.extend(handle_events)
         
         # Update last processed version
         if all_events and current_version > self.last_processed_version:
@@ -260,22 +436,111 @@ class BlockchainMonitor:
             
         return all_events
     
-    async def get_latest_version(self):
-        """Get the latest version (block height) of the blockchain."""
+    async def _fetch_handle_events(self, handle):
+        """Fetch the new events for a single event handle.
+        
+        Args:
+            handle: Event handle info with account, event_handle and field_name
+            
+        Returns:
+            list: Events newer than the last processed version
+        """
+        try:
+            # Use async REST API call
+            url = f"{self.node_url}/accounts/{handle['account']}/events/{handle['event_handle']}/{handle['field_name']}"
+            logger.debug(f"Fetching events from URL: {url}")
+            
+            # Use a single approach for fetching data to avoid event loop issues
+            try:
+                response = await self.client.client.get(url)
+                events_data = _response_json(response)
+            except Exception as e:
+                # If any error occurs, use a simple synchronous request as fallback
+                logger.warning(f"Error with async request, using synchronous fallback: {str(e)}")
+                response = await asyncio.to_thread(self.session.get, url, timeout=HTTP_TIMEOUT)
+                if response.status_code == 200:
+                    events_data = _response_json(response)
+                else:
+                    logger.error(f"Error fetching events: {response.status_code} - {response.text}")
+                    events_data = []
+            
+            if events_data:
+                logger.info(f"Found {len(events_data)} events for {handle['account']}/{handle['event_handle']}/{handle['field_name']}")
+                
+                # Every event from this handle gets the same type, so work it out once
+                handle_path = f"{handle['event_handle']}/{handle['field_name']}"
+                if "token::TokenStore/deposit_events" in handle_path:
+                    handle_type = "token_deposit"
+                elif "token::TokenStore/withdraw_events" in handle_path:
+                    handle_type = "token_withdrawal"
+                elif "coin::CoinStore/deposit_events" in handle_path:
+                    handle_type = "coin_deposit"
+                elif "coin::CoinStore/withdraw_events" in handle_path:
+                    handle_type = "coin_withdrawal"
+                else:
+                    handle_type = "other"
+                
+                # Filter events by version if needed
+                filtered_events = []
+                last_processed_version = self.last_processed_version
+                for event in events_data:
+                    event_version = int(event.get("version", 0))
+                    
+                    if event_version > last_processed_version:
+                        # Enrich event with handle information
+                        event["account"] = handle["account"]
+                        event["event_handle"] = handle["event_handle"]
+                        event["field_name"] = handle["field_name"]
+                        event["type"] = handle_type
+                        
+                        filtered_events.append(event)
+                
+                if filtered_events:
+                    logger.info(f"Found {len(filtered_events)} new events after filtering for {handle['account']}/{handle['event_handle']}/{handle['field_name']}")
+                    return filtered_events
+                else:
+                    logger.info(f"No new events after filtering for {handle['account']}/{handle['event_handle']}/{handle['field_name']}")
+        except Exception as e:
+            logger.error(f"Error fetching events for {handle['account']}/{handle['event_handle']}/{handle['field_name']}: {str(e)}")
+        return []
+    
+    async def get_latest_version(self, max_age=1.0):
+        """Get the latest version (block height) of the blockchain.
+        
+        The polling loop and the API both ask for this, often within the same
+        moment, so a successful answer is reused for max_age seconds.
+        
+        Args:
+            max_age: Seconds a fetched version stays valid
+            
+        Returns:
+            int: The latest version, or 0 if it could not be fetched
+        """
+        fetched_at, version = self._ledger_version_cache
+        if version and time.monotonic() - fetched_at < max_age:
+            return version
+        
+        version = await self._fetch_latest_version()
+        if version:
+            self._ledger_version_cache = (time.monotonic(), version)
+        return version
+    
+    async def _fetch_latest_version(self):
+        """Fetch the latest version (block height) from the node."""
         try:
             # Try to use the async client first
             try:
                 response = await self.client.client.get(f"{self.node_url}")
-                ledger_info = response.json()
+                ledger_info = _response_json(response)
                 return int(ledger_info.get("ledger_version", 0))
             except RuntimeError as e:
-                # If we get an event loop error, fall back to synchronous approach
-                if "Event loop is closed" in str(e):
-                    logger.warning("Event loop is closed, falling back to synchronous request")
-                    import requests
-                    response = requests.get(f"{self.node_url}")
+                # If we get an event loop error (closed, or the client is bound to
+                # another loop), fall back to synchronous approach
+                if "event loop" in str(e).lower():
+                    logger.warning(f"Async client unavailable ({str(e)}), falling back to synchronous request")
+                    response = self.session.get(f"{self.node_url}", timeout=HTTP_TIMEOUT)
                     if response.status_code == 200:
-                        ledger_info = response.json()
+                        ledger_info = _response_json(response)
                         return int(ledger_info.get("ledger_version", 0))
                 else:
                     # Re-raise if it's not an event loop error
@@ -297,6 +562,7 @@ class BlockchainMonitor:
         """
         significant_events = []
         processed_event_ids = set()
+        start_version = self.last_processed_version
         
         try:
             for event in events:
@@ -309,7 +575,6 @@ class BlockchainMonitor:
                         event_id = f"{event['transaction_version']}"
                     else:
                         # Use any unique identifiers available
-                        import hashlib
                         event_str = str(sorted(event.items()))
                         event_id = hashlib.md5(event_str.encode()).hexdigest()
                     
@@ -325,7 +590,6 @@ class BlockchainMonitor:
                     event_version = int(event.get('version', 0))
                     if event_version > self.last_processed_version:
                         self.last_processed_version = event_version
-                        self._save_last_processed_version(event_version)
                     
                     # Check if the event is significant
                     if self._is_significant_event(event):
@@ -334,16 +598,15 @@ class BlockchainMonitor:
                         # Enrich the event with additional information
                         enriched_event = self._enrich_event(event)
                         
-                        # Update metrics for this event
-                        self._update_metrics(enriched_event)
+                        # Update metrics for this event; snapshot() copies them from request threads
+                        with self._recent_lock:
+                            self._update_metrics(enriched_event)
                         
                         # Add to list of significant events
                         significant_events.append(enriched_event)
                         
                         # Add to recent events list, keeping only the most recent 100
-                        self.recent_events.append(enriched_event)
-                        if len(self.recent_events) > 100:
-                            self.recent_events = self.recent_events[-100:]
+                        self.add_recent_event(enriched_event)
                         
                         # Trigger Discord notification if a Discord bot is provided
                         if discord_bot:
@@ -360,6 +623,10 @@ class BlockchainMonitor:
                 except Exception as event_error:
                     logger.error(f"Error processing individual event: {str(event_error)}")
                     continue
+            
+            # Persist the highest version once for the whole batch
+            if self.last_processed_version > start_version:
+                self._save_last_processed_version(self.last_processed_version)
                     
             # Update significant events count
             self.significant_events_count += len(significant_events)
@@ -369,8 +636,248 @@ class BlockchainMonitor:
             logger.error(f"Error processing events: {str(e)}")
             return []
     
+    def snapshot(self, max_age=1.0):
+        """Get a cached view of the monitor state for metrics reporting.
+        
+        The view is rebuilt when it is older than max_age seconds or when
+        recent_events has changed since it was taken. Treat it as read-only.
+        
+        Args:
+            max_age: Maximum age of the cached view in seconds
+            
+        Returns:
+            dict: Monitor counters and settings
+        """
+        with self._recent_lock:
+            snapshot = self._snapshot
+            if (snapshot is None or snapshot["events_version"] != self.events_version
+                    or time.time() - self._snapshot_time >= max_age):
+                snapshot = self._rebuild_snapshot()
+            return snapshot
+    
+    def _rebuild_snapshot(self):
+        """Rebuild the cached state view returned by snapshot(). Caller holds _recent_lock."""
+        # Copy so readers can iterate while the monitor keeps appending to the deque
+        recent_events = list(self.recent_events)
+        
+        # Ensure events_processed is at least the number of recent events
+        if self.events_processed_count < len(recent_events):
+            self.events_processed_count = len(recent_events)
+        
+        snapshot = {
+            "events_version": self.events_version,
+            "events_processed": self.events_processed_count,
+            "significant_events": self.significant_events_count,
+            "last_processed_version": self.last_processed_version,
+            "validated_accounts": list(self.validated_accounts),
+            "event_handles": len(self.event_handles),
+            "polling_interval": self.polling_interval,
+            "start_time": self.start_time,
+            "running": self.running,
+            "recent_events": recent_events,
+            # Aggregates over recent_events, read from the rolling counters and index
+            "recent_category_counts": dict(self.recent_category_counts),
+            "top_recent_tokens": self.top_recent_values('token_name'),
+            "top_recent_accounts": self.top_recent_values('account'),
+            "top_recent_collections": self.top_recent_values('collection_name'),
+            # Detailed activity tracking
+            "event_type_counts": dict(self.event_type_counts),
+            # Top 10 by total events, copied since _update_metrics keeps changing the originals
+            "top_account_activity": _top_activity(self.account_activity),
+            "top_token_activity": _top_activity(self.token_activity),
+            "top_collection_activity": _top_activity(self.collection_activity),
+            "hourly_event_counts": list(self.hourly_event_counts),
+            "daily_event_counts": list(self.daily_event_counts),
+            # Last 60 entries (1 hour at 1 per minute)
+            "version_history": self.version_history[-60:]
+        }
+        self._snapshot = snapshot
+        self._snapshot_time = time.time()
+        return snapshot
+    
+    def add_recent_event(self, event):
+        """Add an event to the recent events list, keeping only the most recent 100.
+        
+        Events without an id are given one. An event whose id is already in
+        the list is ignored.
+        
+        Args:
+            event: The event to add
+            
+        Returns:
+            bool: True if the event was added, False if it was a duplicate
+        """
+        if 'id' not in event:
+            event['id'] = uuid.uuid4().hex
+        event_id = event['id']
+        
+        # Parse the timestamp once here so readers can compare plain floats; kept
+        # beside the event rather than in it so it never reaches API payloads
+        parsed_epoch = _parse_iso_timestamp(event.get('timestamp'))
+        ts_epoch = parsed_epoch if parsed_epoch is not None else time.time()
+        
+        # Work out the index entries before touching any state, so an event that
+        # can't be indexed is never half-added
+        index_keys = _recent_index_keys(event)
+        
+        # Check, evict and append as one step so the aggregates match the deque
+        with self._recent_lock:
+            if event_id in self.recent_events_by_id:
+                return False
+            
+            # The deque drops its oldest event on append once full; take it out of the aggregates first
+            if len(self.recent_events) == self.recent_events.maxlen:
+                self._unindex_recent_event(self.recent_events[0])
+            
+            self.recent_events.append(event)
+            self.events_version += 1
+            self._index_recent_event(event, index_keys)
+            self.recent_event_epochs[event_id] = ts_epoch
+            # Events without a usable timestamp can't be placed in the 24 hour window
+            if parsed_epoch is not None:
+                self._add_to_24h_window(parsed_epoch)
+            return True
+    
+    def recent_event_epoch(self, event):
+        """Return a recent event's parsed timestamp in epoch seconds (0 if unknown)."""
+        return self.recent_event_epochs.get(event.get('id'), 0)
+    
+    def recent_events_view(self):
+        """Return a consistent copy of the recent events and their aggregates.
+        
+        Returns:
+            dict: events_version, events (oldest first), category_counts and
+                filter_values (field -> list of distinct values)
+        """
+        with self._recent_lock:
+            return {
+                "events_version": self.events_version,
+                "events": list(self.recent_events),
+                "category_counts": dict(self.recent_category_counts),
+                "filter_values": {field: list(index) for field, index in self.recent_field_index.items()},
+            }
+    
+    def _add_to_24h_window(self, ts_epoch):
+        """Record an event timestamp in the 24 hour window. Caller holds _recent_lock.
+        
+        The window is kept sorted. Events normally arrive in timestamp order and
+        are appended; backfilled or out-of-order ones are inserted in place.
+        Expired entries are dropped here too, so the window stays bounded even
+        when nothing reads it.
+        
+        Args:
+            ts_epoch: The event timestamp in epoch seconds
+        """
+        cutoff = time.time() - EVENTS_WINDOW_SECONDS
+        self._expire_24h_window(cutoff)
+        if ts_epoch <= cutoff:
+            return
+        window = self.events_24h_times
+        if not window or ts_epoch >= window[-1]:
+            window.append(ts_epoch)
+        else:
+            bisect.insort(window, ts_epoch)
+    
+    def _expire_24h_window(self, cutoff):
+        """Pop timestamps at or before cutoff off the sorted window. Caller holds _recent_lock."""
+        window = self.events_24h_times
+        while window and window[0] <= cutoff:
+            window.popleft()
+    
+    def tick_24h_window(self, now=None):
+        """Drop expired entries from the 24 hour window and return its size.
+        
+        Args:
+            now: Current time in epoch seconds (defaults to time.time())
+            
+        Returns:
+            int: Number of events added with a timestamp in the last 24 hours
+        """
+        cutoff = (now if now is not None else time.time()) - EVENTS_WINDOW_SECONDS
+        with self._recent_lock:
+            self._expire_24h_window(cutoff)
+            return len(self.events_24h_times)
+    
+    def find_recent_events(self, criteria):
+        """Find recent events matching all of the given field values.
+        
+        Uses the inverted index, so the cost depends on the number of matches
+        rather than the number of recent events.
+        
+        Args:
+            criteria: List of (field, value) pairs; fields from RECENT_EVENT_FILTER_FIELDS
+            
+        Returns:
+            list: Matching events, oldest first
+        """
+        with self._recent_lock:
+            postings = []
+            for field, value in criteria:
+                ids = self.recent_field_index[field].get(value)
+                if not ids:
+                    return []
+                postings.append(ids)
+            
+            # Intersect starting from the smallest posting set
+            postings.sort(key=len)
+            hits = postings[0].intersection(*postings[1:])
+            
+            seq = self.recent_event_seq
+            by_id = self.recent_events_by_id
+            ordered_ids = sorted(hits, key=lambda event_id: seq.get(event_id, 0))
+            return [by_id[event_id] for event_id in ordered_ids if event_id in by_id]
+    
+    def top_recent_values(self, field, n=5):
+        """Return the most common values of a field among the recent events.
+        
+        Args:
+            field: One of RECENT_EVENT_FILTER_FIELDS
+            n: Number of values to return
+            
+        Returns:
+            dict: Value -> number of recent events, most common first
+        """
+        with self._recent_lock:
+            top = heapq.nlargest(n, self.recent_field_index[field].items(), key=lambda entry: len(entry[1]))
+            return {value: len(ids) for value, ids in top}
+    
+    def _index_recent_event(self, event, index_keys):
+        """Add an event to the rolling aggregates and the inverted index. Caller holds _recent_lock.
+        
+        Args:
+            event: The event being added
+            index_keys: The event's _recent_index_keys
+        """
+        event_id = event['id']
+        category, entries = index_keys
+        self.recent_events_by_id[event_id] = event
+        self.recent_event_seq[event_id] = self.events_version
+        self.recent_category_counts[category] += 1
+        for field, value in entries:
+            self.recent_field_index[field].setdefault(value, set()).add(event_id)
+    
+    def _unindex_recent_event(self, event):
+        """Remove an evicted event from the rolling aggregates and the inverted index. Caller holds _recent_lock."""
+        event_id = event['id']
+        category, entries = _recent_index_keys(event)
+        self.recent_events_by_id.pop(event_id, None)
+        self.recent_event_seq.pop(event_id, None)
+        self.recent_event_epochs.pop(event_id, None)
+        
+        self.recent_category_counts[category] -= 1
+        if self.recent_category_counts[category] <= 0:
+            del self.recent_category_counts[category]
+        
+        for field, value in entries:
+            index = self.recent_field_index[field]
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(event_id)
+                if not ids:
+                    del index[value]
+    
     def _update_metrics(self, event):
-        """Update metrics based on an event.
+        """Update metrics based on an event. Caller holds _recent_lock.
         
         Args:
             event: The event to update metrics for
@@ -378,7 +885,7 @@ class BlockchainMonitor:
         try:
             # Update event type counts
             event_category = event.get('event_category', 'other')
-            self.event_type_counts[event_category] = self.event_type_counts.get(event_category, 0) + 1
+            self.event_type_counts[event_category] += 1
             
             # Update account activity
             if 'account' in event:
@@ -532,15 +1039,8 @@ class BlockchainMonitor:
             
             # Simplify event type for better readability
             if 'event_type' in enriched:
-                event_type = enriched['event_type']
-                if '::token::TokenStore/deposit_events' in event_type:
-                    enriched['event_category'] = 'token_deposit'
-                elif '::token::TokenStore/withdraw_events' in event_type:
-                    enriched['event_category'] = 'token_withdrawal'
-                elif 'coin::CoinStore' in event_type:
-                    enriched['event_category'] = 'coin_transfer'
-                else:
-                    enriched['event_category'] = 'other'
+                match = EVENT_CATEGORY_PATTERN.search(enriched['event_type'])
+                enriched['event_category'] = EVENT_CATEGORIES[match.lastindex - 1] if match else 'other'
             
             # Add transaction URL
             if 'version' in enriched:
@@ -578,11 +1078,14 @@ class BlockchainMonitor:
                     
                     # Convert amount to APT for coin transfers
                     if enriched.get('event_category') == 'coin_transfer':
-                        try:
-                            amount_apt = float(data['amount']) / 100000000  # 8 decimal places for APT
-                            enriched['amount_apt'] = amount_apt
-                        except:
-                            pass
+                        amount = data['amount']
+                        if type(amount) is int:
+                            enriched['amount_apt'] = amount / OCTAS_PER_APT
+                        else:
+                            try:
+                                enriched['amount_apt'] = float(amount) / OCTAS_PER_APT
+                            except (TypeError, ValueError):
+                                pass
                 
                 # Extract other useful fields
                 for key in ['type', 'from', 'to', 'creator']:
@@ -593,19 +1096,16 @@ class BlockchainMonitor:
             enriched['details'] = simplified_data
             
             # Add a description for the event
-            if enriched.get('event_category') == 'token_deposit':
-                token_name = enriched.get('token_name', 'token')
-                collection = enriched.get('collection_name', 'collection')
-                enriched['description'] = f"Token deposit: {token_name} from {collection}"
-            elif enriched.get('event_category') == 'token_withdrawal':
-                token_name = enriched.get('token_name', 'token')
-                collection = enriched.get('collection_name', 'collection')
-                enriched['description'] = f"Token withdrawal: {token_name} from {collection}"
-            elif enriched.get('event_category') == 'coin_transfer':
-                amount_apt = enriched.get('amount_apt', 0)
-                enriched['description'] = f"Coin transfer: {amount_apt:.8f} APT"
+            get = enriched.get
+            event_category = get('event_category')
+            if event_category == 'token_deposit':
+                enriched['description'] = f"Token deposit: {get('token_name', 'token')} from {get('collection_name', 'collection')}"
+            elif event_category == 'token_withdrawal':
+                enriched['description'] = f"Token withdrawal: {get('token_name', 'token')} from {get('collection_name', 'collection')}"
+            elif event_category == 'coin_transfer':
+                enriched['description'] = f"Coin transfer: {get('amount_apt', 0):.8f} APT"
             else:
-                enriched['description'] = f"Blockchain event: {enriched.get('event_type', 'unknown')}"
+                enriched['description'] = f"Blockchain event: {get('event_type', 'unknown')}"
             
             # Add importance score (all events are now considered significant)
             enriched['importance_score'] = 1.0
@@ -613,21 +1113,21 @@ class BlockchainMonitor:
             # Add a unique ID for the event if not present
             if 'id' not in enriched:
                 # Create a unique ID based on event data
-                event_str = json.dumps(enriched, sort_keys=True)
-                enriched['id'] = hashlib.md5(event_str.encode()).hexdigest()
+                event_bytes = orjson.dumps(enriched, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+                enriched['id'] = hashlib.md5(event_bytes).hexdigest()
             
             # Create a clean version of the event with only the most relevant fields
             clean_event = {
-                'id': enriched.get('id', ''),
-                'event_type': enriched.get('event_type', 'unknown'),
-                'event_category': enriched.get('event_category', 'other'),
-                'timestamp': enriched.get('timestamp', ''),
-                'account': enriched.get('account', ''),
-                'version': enriched.get('version', ''),
-                'description': enriched.get('description', ''),
+                'id': get('id', ''),
+                'event_type': get('event_type', 'unknown'),
+                'event_category': get('event_category', 'other'),
+                'timestamp': get('timestamp', ''),
+                'account': get('account', ''),
+                'version': get('version', ''),
+                'description': enriched['description'],
                 'details': simplified_data,
-                'transaction_url': enriched.get('transaction_url', ''),
-                'account_url': enriched.get('account_url', '')
+                'transaction_url': get('transaction_url', ''),
+                'account_url': get('account_url', '')
             }
             
             # Add token-specific fields if present
@@ -640,7 +1140,7 @@ class BlockchainMonitor:
             
             # Convert to JSON-serializable format
             # This ensures that the event can be properly sent to the UI
-            return json.loads(json.dumps(clean_event, default=str))
+            return orjson.loads(orjson.dumps(clean_event, default=str, option=orjson.OPT_NON_STR_KEYS))
             
         except Exception as e:
             logger.error(f"Error enriching event: {str(e)}")
@@ -701,8 +1201,11 @@ class BlockchainMonitor:
                 
             logger.info(f"Processing {len(events)} events")
             
-            # Process events to find significant ones
-            significant_events = self.process_events(events, discord_bot)
+            # Process events to find significant ones; this saves the version file and
+            # generates Discord insights, so keep it off the event loop
+            significant_events = await asyncio.to_thread(self.process_events, events, discord_bot)
+            if self.async_event_callbacks and significant_events:
+                await self._run_async_callbacks(significant_events)
             
             # Update counters
             self.significant_events_count += len(significant_events)
@@ -737,25 +1240,46 @@ class BlockchainMonitor:
             list: List of significant events
         """
         try:
-            # Use a simple synchronous approach to avoid event loop issues
-            import asyncio
-            
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # Run the async method and get the events
-                events = loop.run_until_complete(self.poll_for_events_async(discord_bot))
-                return events
-            finally:
-                # Always close the loop to prevent resource leaks
-                loop.close()
+            # Run on the long-lived polling loop rather than creating a loop per call
+            return self.run_on_poll_loop(self.poll_for_events_async(discord_bot))
                 
         except Exception as e:
             logger.error(f"Error in poll_for_events: {str(e)}")
             return []
     
+    def run_on_poll_loop(self, coro, timeout=None):
+        """Run a coroutine on the polling loop from another thread and wait for it.
+        
+        The node client's async HTTP connections belong to the polling loop, so
+        any coroutine that uses them must run there, whichever thread asks.
+        
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait for the result (None waits indefinitely)
+            
+        Returns:
+            The coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_poll_loop())
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    def _get_poll_loop(self):
+        """Return the polling event loop, starting it in a daemon thread if needed.
+        
+        Returns:
+            asyncio.AbstractEventLoop: The running polling loop
+        """
+        with self._poll_loop_lock:
+            if self._poll_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="blockchain-poll-loop", daemon=True).start()
+                self._poll_loop = loop
+            return self._poll_loop
+    
     def _is_significant_event(self, event):
         """Determine if an event is significant.
         
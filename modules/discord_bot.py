@@ -1,16 +1,49 @@
 # modules/discord_bot.py
 import discord
+import hashlib
+import json
+import logging
 import os
 import asyncio
 import aiohttp
 import random
 import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from discord.ext import commands, tasks
 from utils.logger import get_logger
 
 logger = get_logger("discord_bot")
 
+# Discord accepts at most 10 embeds, totalling at most 6000 characters, in a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+def _chunk_embeds(embeds):
+    """Split embeds into groups that each fit in one Discord message.
+    
+    Args:
+        embeds: The Discord embeds to send, in order
+        
+    Yields:
+        list: Consecutive embeds within both the count and the character limit
+    """
+    chunk = []
+    chunk_chars = 0
+    for embed in embeds:
+        embed_chars = len(embed)
+        if chunk and (len(chunk) == MAX_EMBEDS_PER_MESSAGE
+                      or chunk_chars + embed_chars > MAX_EMBED_CHARS_PER_MESSAGE):
+            yield chunk
+            chunk = []
+            chunk_chars = 0
+        chunk.append(embed)
+        chunk_chars += embed_chars
+    if chunk:
+        yield chunk
+
 class DiscordBot:
     """Discord bot for social media management."""
     
@@ -30,11 +63,25 @@ class DiscordBot:
         # Message queue for rate limiting
         self.message_queue = asyncio.Queue()
         
+        # Hand-off from other threads and loops to the bot loop; deque appends and
+        # pops are atomic, so producers never need the bot's loop or a lock
+        self._pending_messages = deque()
+        
         # Last post time tracking
         self.last_post_time = datetime.now() - timedelta(days=1)
         
-        # Track posted events to avoid duplicates
-        self.posted_events = set()
+        # Track posted events to avoid duplicates; insertion-ordered so the
+        # oldest ids are evicted first, and locked since posts come from several threads
+        self.posted_events = OrderedDict()
+        self.posted_events_lock = threading.Lock()
+        
+        # Dedicated pool for blocking AI calls so slow LLM requests don't
+        # tie up the default executor used for short housekeeping work
+        self.ai_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ai')
+        
+        # Keep-alive HTTP sessions for webhook calls, one per event loop since
+        # aiohttp sessions can only be used from the loop that created them
+        self._http_sessions = {}
         
         # Set up event handlers and commands
         self._setup_bot()
@@ -109,39 +156,19 @@ class DiscordBot:
                 return
                 
             # Get the most recent events
-            events_to_show = recent_events[-count:]
+            events_to_show = list(recent_events)[-count:]
+            
+            # Generate insights for all events concurrently; each call is a blocking
+            # AI request, so run them on the AI worker pool instead of one after another
+            loop = asyncio.get_running_loop()
+            all_insights = await asyncio.gather(
+                *(loop.run_in_executor(self.ai_executor, self.ai_module.generate_insights, event)
+                  for event in events_to_show)
+            )
             
             # Create an embed for each event
-            for event in events_to_show:
-                event_category = event.get('event_category', 'unknown')
-                
-                # Generate insights using AI module
-                insights = self.ai_module.generate_insights(event)
-                
-                # Create Discord embed
-                embed = discord.Embed(
-                    title=insights["title"],
-                    description=insights["message"],
-                    color=self._get_color_for_event_type(event_category),
-                    timestamp=datetime.now()
-                )
-                
-                # Add fields with additional information
-                embed.add_field(name="Account", value=self._format_account_link(event.get("account", "Unknown"), event.get("account_url", "")), inline=True)
-                
-                # Add token information if available
-                if "token_name" in event:
-                    embed.add_field(name="Token", value=event["token_name"], inline=True)
-                    embed.add_field(name="Collection", value=event.get("collection_name", "Unknown"), inline=True)
-                    
-                # Add amount for coin transfers
-                if "amount_apt" in event:
-                    embed.add_field(name="Amount", value=f"{event['amount_apt']:.8f} APT", inline=True)
-                    
-                # Add transaction link if available
-                if "transaction_url" in event and event["transaction_url"]:
-                    embed.add_field(name="Transaction", value=f"[View on Explorer]({event['transaction_url']})", inline=False)
-                
+            for event, insights in zip(events_to_show, all_insights):
+                embed = self._build_event_embed(event, insights)
                 await ctx.send(embed=embed)
         
         @self.bot.command(name='status')
@@ -271,7 +298,8 @@ class DiscordBot:
         @self.bot.command(name='aptos')
         async def aptos_info(ctx):
             """Get information about Aptos blockchain."""
-            response = self.ai_module.get_answer("what is aptos")
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self.ai_executor, self.ai_module.get_answer, "what is aptos")
             await ctx.send(response["answer"])
         
         @self.bot.command(name='blockchain_info')
@@ -473,7 +501,7 @@ class DiscordBot:
                 return
                 
             response = ["**Latest Blockchain Events**:"]
-            for event in recent_events[-5:]:
+            for event in list(recent_events)[-5:]:
                 event_type = event.get("event_category", "unknown")
                 description = event.get("description", "No description available")
                 response.append(f"- {event_type}: {description}")
@@ -497,13 +525,36 @@ class DiscordBot:
             if is_mention:
                 question = question.replace(f'<@{self.bot.user.id}>', '').strip()
             
-            # Get answer
-            response = self.ai_module.get_answer(question)
+            # Get answer on the AI worker pool; a fallback LLM call would
+            # otherwise block the bot's event loop and its gateway heartbeat
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(self.ai_executor, self.ai_module.get_answer, question)
             
             # Only respond if confidence is high enough
             if response["confidence"] >= 0.5:
                 await message.reply(response["answer"])
     
+    async def _get_http_session(self):
+        """Get the shared aiohttp session for the running event loop.
+        
+        Returns:
+            aiohttp.ClientSession: Session with a pooled keep-alive connector
+        """
+        loop = asyncio.get_running_loop()
+        session = self._http_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+            self._http_sessions[loop] = session
+        return session
+    
+    async def _close_http_session(self):
+        """Close the aiohttp session owned by the running event loop, if any."""
+        session = self._http_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+    
     async def send_webhook(self, embed, webhook_url):
         """Send a message to a Discord webhook.
         
@@ -511,16 +562,25 @@ class DiscordBot:
             embed: The Discord embed to send
             webhook_url: The webhook URL to send to
         """
+        return await self.send_webhook_batch([embed], webhook_url)
+    
+    async def send_webhook_batch(self, embeds, webhook_url):
+        """Send embeds to a Discord webhook, as few messages as Discord's limits allow.
+        
+        Args:
+            embeds: The Discord embeds to send
+            webhook_url: The webhook URL to send to
+        
+        Returns:
+            bool: True if every message was sent, False otherwise
+        """
         try:
-            # Create a Discord webhook
-            webhook = discord.Webhook.from_url(webhook_url, session=None)
-            
-            # Use an async context manager for the session
-            async with aiohttp.ClientSession() as session:
-                webhook_with_session = discord.Webhook.from_url(webhook_url, session=session)
-                await webhook_with_session.send(embed=embed)
+            session = await self._get_http_session()
+            webhook_with_session = discord.Webhook.from_url(webhook_url, session=session)
+            for chunk in _chunk_embeds(embeds):
+                await webhook_with_session.send(embeds=chunk)
                 
-            logger.info("Webhook message sent successfully")
+            logger.info(f"Webhook message sent successfully ({len(embeds)} embeds)")
             return True
         except Exception as e:
             logger.error(f"Error sending webhook: {str(e)}")
@@ -544,23 +604,14 @@ class DiscordBot:
                 event_id = f"{event['transaction_version']}"
             else:
                 # Create a hash of the event data for non-standard events
-                import hashlib
                 event_str = str(sorted(event.items()))
                 event_id = hashlib.md5(event_str.encode()).hexdigest()
             
             # Check if we've already posted this event
-            if event_id in self.posted_events:
+            if not self._mark_posted(event_id):
                 logger.info(f"Skipping duplicate event with ID: {event_id}")
                 return False
             
-            # Add to posted events set
-            self.posted_events.add(event_id)
-            
-            # Limit the size of posted_events to avoid memory issues
-            if len(self.posted_events) > 1000:
-                # Keep only the most recent 500 events
-                self.posted_events = set(list(self.posted_events)[-500:])
-            
             # Process event data
             event_category = event.get('event_category', 'unknown')
             logger.info(f"Processing blockchain event for Discord: {event_category}")
@@ -568,13 +619,8 @@ class DiscordBot:
             # Generate insights using AI module
             insights = self.ai_module.generate_insights(event)
             
-            # Create Discord embed
-            embed = discord.Embed(
-                title=insights["title"],
-                description=insights["message"],
-                color=self._get_color_for_event_type(event_category),
-                timestamp=datetime.now()
-            )
+            # Create Discord embed with the event detail fields
+            embed = self._build_event_embed(event, insights, collection_without_token=True)
             
             # Generate meme image if enabled in config
             if self.config.AI.get("GENERATE_IMAGES", False):
@@ -589,25 +635,6 @@ class DiscordBot:
                 except Exception as meme_error:
                     logger.error(f"Error generating meme: {str(meme_error)}")
             
-            # Add fields with additional information
-            embed.add_field(name="Account", value=self._format_account_link(event.get("account", "Unknown"), event.get("account_url", "")), inline=True)
-            
-            # Add token information if available
-            if "token_name" in event:
-                embed.add_field(name="Token", value=event["token_name"], inline=True)
-                
-            # Add collection if available
-            if "collection_name" in event:
-                embed.add_field(name="Collection", value=event["collection_name"], inline=True)
-                
-            # Add amount for coin transfers
-            if "amount_apt" in event:
-                embed.add_field(name="Amount", value=f"{event['amount_apt']:.8f} APT", inline=True)
-                
-            # Add transaction link if available
-            if "transaction_url" in event and event["transaction_url"]:
-                embed.add_field(name="Transaction", value=f"[View on Explorer]({event['transaction_url']})", inline=False)
-            
             # Add conversation starter
             embed.add_field(name="Let's chat!", value="What do you think about this event?", inline=False)
             
@@ -624,15 +651,99 @@ class DiscordBot:
             logger.error(f"Error posting blockchain event: {str(e)}")
             return False
     
+    async def post_content(self, content):
+        """Queue generated content (a post or meme) for posting to Discord.
+        
+        Args:
+            content (dict): Content produced by the AI module
+        
+        Returns:
+            bool: True if the content was queued, False if it was a duplicate
+        """
+        # Check for duplicate posts
+        event_ref = content.get("event_reference", "")
+        if event_ref and not self._mark_posted(event_ref):
+            logger.info(f"Skipping duplicate content: {event_ref}")
+            return False
+        
+        # Create Discord embed
+        embed = discord.Embed(
+            title=content.get("title"),
+            description=content.get("content") or content.get("message", ""),
+            color=self._get_color_for_event_type("other"),
+            timestamp=datetime.now()
+        )
+        if content.get("image_url"):
+            embed.set_image(url=content["image_url"])
+        
+        # Hand over through the pending list; the message queue belongs to the bot's loop
+        self._sync_add_to_queue({'embed': embed, 'event_id': event_ref})
+        
+        return True
+    
+    def _build_event_embed(self, event, insights, collection_without_token=False):
+        """Build the Discord embed for a blockchain event and its AI insights.
+        
+        Args:
+            event (dict): Blockchain event data
+            insights (dict): Generated insights with "title" and "message"
+            collection_without_token (bool): Also show the collection for events without a token
+            
+        Returns:
+            discord.Embed: Embed with the event's detail fields
+        """
+        embed = discord.Embed(
+            title=insights["title"],
+            description=insights["message"],
+            color=self._get_color_for_event_type(event.get('event_category', 'unknown')),
+            timestamp=datetime.now()
+        )
+        
+        embed.add_field(name="Account", value=self._format_account_link(event.get("account", "Unknown"), event.get("account_url", "")), inline=True)
+        
+        # Add token and collection information if available
+        if "token_name" in event:
+            embed.add_field(name="Token", value=event["token_name"], inline=True)
+            embed.add_field(name="Collection", value=event.get("collection_name", "Unknown"), inline=True)
+        elif collection_without_token and "collection_name" in event:
+            embed.add_field(name="Collection", value=event["collection_name"], inline=True)
+        
+        # Add amount for coin transfers
+        if "amount_apt" in event:
+            embed.add_field(name="Amount", value=f"{event['amount_apt']:.8f} APT", inline=True)
+        
+        # Add transaction link if available
+        if event.get("transaction_url"):
+            embed.add_field(name="Transaction", value=f"[View on Explorer]({event['transaction_url']})", inline=False)
+        
+        return embed
+    
+    def _mark_posted(self, event_id, max_size=1000):
+        """Record an event id as posted, unless it already was.
+        
+        Args:
+            event_id: Id of the event or content being posted
+            max_size: Number of ids to remember; the oldest are forgotten first
+        
+        Returns:
+            bool: True if the id is new, False if it was already posted
+        """
+        with self.posted_events_lock:
+            if event_id in self.posted_events:
+                self.posted_events.move_to_end(event_id)
+                return False
+            self.posted_events[event_id] = None
+            if len(self.posted_events) > max_size:
+                self.posted_events.popitem(last=False)
+            return True
+    
     def _sync_add_to_queue(self, message_data):
         """Add a message to the queue from a non-async context.
         
         Args:
             message_data: The message data to add to the queue
         """
-        # Store in a class level list that will be processed by the queue processor
-        if not hasattr(self, '_pending_messages'):
-            self._pending_messages = []
+        # Picked up by the queue processor on the bot's loop
         self._pending_messages.append(message_data)
     
     def _format_account_link(self, account, account_url):
@@ -680,16 +791,12 @@ class DiscordBot:
     async def process_message_queue(self):
         """Process messages in the queue with rate limiting."""
         # First, check if there are any pending messages from non-async contexts
-        if hasattr(self, '_pending_messages') and self._pending_messages:
-            # Get the count before moving
-            pending_count = len(self._pending_messages)
-            
-            # Move pending messages to the async queue
-            for message in self._pending_messages:
-                await self.message_queue.put(message)
-            
-            # Clear the pending messages
-            self._pending_messages = []
+        pending_count = 0
+        while self._pending_messages:
+            # Pop one at a time so messages appended meanwhile are never dropped
+            await self.message_queue.put(self._pending_messages.popleft())
+            pending_count += 1
+        if pending_count:
             logger.info(f"Moved {pending_count} pending messages to async queue")
         
         # Check if there are any messages to process
@@ -721,22 +828,17 @@ class DiscordBot:
                 webhook_url = self.config.DISCORD.get("WEBHOOK_URL", None)
                 channel_id = self.config.DISCORD.get("CHANNEL_ID", None)
                 
+                embeds = [message['embed'] for message in messages_to_post]
                 if webhook_url:
-                    # Post each message
-                    for message in messages_to_post:
-                        # Post with webhook
-                        await self.send_webhook(message['embed'], webhook_url)
-                        # Brief delay between messages
-                        await asyncio.sleep(1)
+                    # Post the whole batch in one webhook message
+                    await self.send_webhook_batch(embeds, webhook_url)
                 elif channel_id:
                     # Get channel
                     channel = self.bot.get_channel(int(channel_id))
                     if channel:
-                        # Post each message
-                        for message in messages_to_post:
-                            await channel.send(embed=message['embed'])
-                            # Brief delay between messages
-                            await asyncio.sleep(1)
+                        # Post the batch in as few channel messages as the limits allow
+                        for chunk in _chunk_embeds(embeds):
+                            await channel.send(embeds=chunk)
                 
                 # Update last post time
                 self.last_post_time = current_time
@@ -911,6 +1013,7 @@ class DiscordBot:
                 loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
                 webhook_sent = loop.run_until_complete(self.send_webhook(embed, webhook_url))
+                loop.run_until_complete(self._close_http_session())
                 loop.close()
                 logger.info(f"Test webhook sent: {webhook_sent}")
             except Exception as e:
@@ -979,9 +1082,6 @@ class DiscordBot:
             return False
             
         try:
-            import aiohttp
-            import json
-            
             # Create a simple webhook payload
             webhook_data = {
                 "content": "🧪 **WEBHOOK TEST** - If you can see this message, webhook notifications are working!",
@@ -1016,21 +1116,23 @@ class DiscordBot:
             }
             
             logger.info(f"Sending test webhook to {webhook_url[:20]}...")
-            logger.info(f"Webhook payload: {json.dumps(webhook_data)[:200]}...")
-            
-            # Send webhook using aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=webhook_data) as response:
-                    status = response.status
-                    logger.info(f"Webhook response status: {status}")
-                    
-                    if status == 204:
-                        logger.info("Successfully sent test webhook")
-                        return True
-                    else:
-                        response_text = await response.text()
-                        logger.error(f"Failed to send test webhook: HTTP {status}, Response: {response_text}")
-                        return False
+            # Only serialize the payload when INFO records are actually emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Webhook payload: {json.dumps(webhook_data)[:200]}...")
+            
+            # Send webhook using the shared aiohttp session
+            session = await self._get_http_session()
+            async with session.post(webhook_url, json=webhook_data) as response:
+                status = response.status
+                logger.info(f"Webhook response status: {status}")
+                
+                if status == 204:
+                    logger.info("Successfully sent test webhook")
+                    return True
+                else:
+                    response_text = await response.text()
+                    logger.error(f"Failed to send test webhook: HTTP {status}, Response: {response_text}")
+                    return False
         except Exception as webhook_error:
             logger.error(f"Error sending test webhook: {str(webhook_error)}")
             return False
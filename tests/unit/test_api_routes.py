@@ -0,0 +1,229 @@
+"""
+Unit tests for the API routes against the real BlockchainMonitor.
+"""
+
+import time
+import pytest
+from collections import OrderedDict
+from types import SimpleNamespace
+
+from api import routes
+from api.app import create_app
+from modules.blockchain import BlockchainMonitor
+
+
+class FakeAI:
+    """AI module stand-in that generates a fixed post."""
+
+    def generate_post(self, event):
+        """Return a post for the event."""
+        return {"content": f"New {event.event_type}", "event_type": event.event_type}
+
+
+class FakeDiscordBot:
+    """Discord bot stand-in that records posted content."""
+
+    def __init__(self):
+        """Initialize the bot."""
+        self.posted = []
+
+    async def post_content(self, content):
+        """Record the content instead of posting it."""
+        self.posted.append(content)
+        return True
+
+    def post_blockchain_event(self, event):
+        """Record the event instead of posting it."""
+        self.posted.append(event)
+        return True
+
+
+@pytest.fixture
+def monitor():
+    """Create a real blockchain monitor that never calls the node."""
+    mon = BlockchainMonitor(SimpleNamespace(BLOCKCHAIN={"POLLING_INTERVAL": 60}, MONITOR={}))
+    mon.get_latest_version = None
+    return mon
+
+
+@pytest.fixture
+def client(monitor):
+    """Create a test client with module references and route caches reset."""
+    app = create_app(SimpleNamespace(API={}))
+    routes._events_cache = {"version": -1, "responses": OrderedDict()}
+    routes._metrics_cache = {"sig": None, "time": 0.0, "metrics": None, "etag": None}
+    routes.initialize_modules(monitor, FakeAI(), FakeDiscordBot())
+    try:
+        yield app.test_client()
+    finally:
+        routes.initialize_modules(None, None, None)
+
+
+class TestTestEvents:
+    """Test cases for /api/test_events."""
+
+    def test_rejects_non_object_events(self, client, monitor):
+        """Test a list holding a non-object is rejected before any event is added."""
+        response = client.post("/api/test_events", json=[{"id": "a"}, "b"])
+
+        assert response.status_code == 400
+        assert len(monitor.recent_events) == 0
+
+    def test_unhashable_fields_do_not_break_ingestion(self, client, monitor):
+        """Test an event with a list account doesn't stop later events from being added."""
+        assert client.post("/api/test_events", json=[{"id": "x", "account": ["a"]}]).status_code == 200
+        for i in range(monitor.recent_events.maxlen):
+            assert monitor.add_recent_event({"id": f"e{i}", "event_category": "nft_sale"}) is True
+
+        assert "x" not in monitor.recent_events_by_id
+
+
+def _add_event(monitor, event_id, **fields):
+    """Add a minimal enriched event to the monitor."""
+    monitor.add_recent_event(dict(
+        fields, id=event_id, event_category="nft_sale", account="0x1",
+        timestamp="2025-01-01T00:00:00+00:00"
+    ))
+
+
+class TestConditionalGet:
+    """Test cases for ETags and 304 responses on /api/events and /api/metrics."""
+
+    def test_events_not_modified_until_events_change(self, client, monitor):
+        """Test a matching If-None-Match gets 304 until a new event arrives."""
+        _add_event(monitor, "a")
+
+        response = client.get("/api/events")
+        assert response.status_code == 200
+        etag = response.headers["ETag"].strip('"')
+        assert etag == f"{routes._BOOT_ID}-{monitor.events_version}"
+
+        response = client.get("/api/events", headers={"If-None-Match": f'"{etag}"'})
+        assert response.status_code == 304
+
+        _add_event(monitor, "b")
+        response = client.get("/api/events", headers={"If-None-Match": f'"{etag}"'})
+        assert response.status_code == 200
+        assert {event["id"] for event in response.get_json()["events"]} == {"a", "b"}
+
+    def test_metrics_not_modified_while_state_unchanged(self, client):
+        """Test a repeated metrics request with the ETag gets 304."""
+        response = client.get("/api/metrics")
+        assert response.status_code == 200
+        etag = response.headers["ETag"].strip('"')
+        assert etag.startswith(f"metrics-{routes._BOOT_ID}-")
+
+        response = client.get("/api/metrics", headers={"If-None-Match": f'"{etag}"'})
+        assert response.status_code == 304
+
+    def test_metrics_etag_survives_recompute(self, client, monitor, monkeypatch):
+        """Test metrics recomputed after the cache expires keep their ETag if nothing changed."""
+        etag = client.get("/api/metrics").headers["ETag"]
+
+        # A dashboard poll after the cache TTL, with the uptime moved on
+        later = time.time() + routes._METRICS_CACHE_TTL + 1
+        monkeypatch.setattr("api.routes.time.time", lambda: later)
+        response = client.get("/api/metrics", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        _add_event(monitor, "a")
+        response = client.get("/api/metrics", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+class TestEventJobs:
+    """Test cases for the asynchronous /api/event job flow."""
+
+    def test_event_job_completes(self, client):
+        """Test a posted event is accepted with 202 and its job reaches done."""
+        response = client.post("/api/event", json={"event_type": "nft_sale", "details": {}})
+        assert response.status_code == 202
+        body = response.get_json()
+        assert body["status"] == "pending"
+
+        deadline = time.time() + 5
+        while True:
+            job = client.get(f"/api/event/{body['job_id']}").get_json()
+            if job["status"] == "done" or time.time() > deadline:
+                break
+            time.sleep(0.01)
+
+        assert job["status"] == "done"
+        assert job["content"] == "New nft_sale"
+
+    def test_unknown_job(self, client):
+        """Test an unknown job id gets 404."""
+        assert client.get("/api/event/missing").status_code == 404
+
+    def test_full_queue_is_rejected(self, client, monkeypatch):
+        """Test events are refused with 503 once the job queue is full, leaving no job behind."""
+        import queue
+
+        full_queue = queue.Queue(maxsize=1)
+        full_queue.put_nowait(None)
+        monkeypatch.setattr(routes, "_event_job_queue", full_queue)
+        jobs_before = len(routes._event_jobs)
+
+        response = client.post("/api/event", json={"event_type": "nft_sale", "details": {}})
+
+        assert response.status_code == 503
+        assert len(routes._event_jobs) == jobs_before
+
+
+class TestBatch:
+    """Test cases for /api/batch."""
+
+    def test_rejects_non_object_body(self, client):
+        """Test a JSON array body is rejected with 400 instead of a server error."""
+        response = client.post("/api/batch", json=[{"path": "/api/status"}])
+        assert response.status_code == 400
+
+    def test_rejects_oversized_batch(self, client):
+        """Test a batch with more than the allowed number of requests is rejected."""
+        requests = [{"path": "/api/status"}] * (routes._MAX_BATCH_REQUESTS + 1)
+        response = client.post("/api/batch", json={"requests": requests})
+        assert response.status_code == 400
+
+    def test_runs_requests_in_order(self, client, monitor):
+        """Test each batched path gets its own status and body."""
+        _add_event(monitor, "a")
+        response = client.post("/api/batch", json={"requests": [
+            {"path": "/api/events?limit=1"}, {"path": "/api/unknown"}, {"path": 5}
+        ]})
+
+        statuses = [entry["status"] for entry in response.get_json()["responses"]]
+        assert statuses == [200, 404, 404]
+
+
+class TestEventsCache:
+    """Test cases for the cached /api/events responses."""
+
+    def test_cached_body_has_fresh_timestamp(self, client, monitor):
+        """Test a response served from the cache carries the current time."""
+        _add_event(monitor, "a")
+        first = client.get("/api/events").get_json()
+        time.sleep(0.01)
+        second = client.get("/api/events").get_json()
+
+        assert second["events"] == first["events"]
+        assert second["timestamp"] > first["timestamp"]
+        assert routes._EVENTS_TIMESTAMP_PLACEHOLDER not in str(second)
+
+    def test_cache_is_bounded(self, client, monitor):
+        """Test distinct queries never grow the cache past its limit."""
+        _add_event(monitor, "a")
+        for limit in range(1, routes._EVENTS_CACHE_SIZE + 20):
+            assert client.get(f"/api/events?limit={limit}").status_code == 200
+
+        assert len(routes._events_cache["responses"]) == routes._EVENTS_CACHE_SIZE
+
+    def test_cache_is_dropped_when_events_change(self, client, monitor):
+        """Test a new event replaces cached responses instead of serving stale ones."""
+        _add_event(monitor, "a")
+        client.get("/api/events")
+        _add_event(monitor, "b")
+
+        events = client.get("/api/events").get_json()["events"]
+        assert {event["id"] for event in events} == {"a", "b"}
+        assert routes._events_cache["version"] == monitor.events_version
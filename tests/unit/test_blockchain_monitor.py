@@ -0,0 +1,268 @@
+"""
+Unit tests for the real BlockchainMonitor's in-memory state.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from modules.blockchain import BlockchainMonitor
+
+
+class LoopBoundClient:
+    """Fake async HTTP client that, like httpx, only works on the loop it first ran on."""
+
+    def __init__(self, ledger_version):
+        """Initialize the client."""
+        self.ledger_version = ledger_version
+        self.loop = None
+
+    async def get(self, url):
+        """Return a ledger info response, failing if called from a different loop."""
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop:
+            raise RuntimeError("<Event> is bound to a different event loop")
+        return SimpleNamespace(
+            status_code=200,
+            content=f'{{"ledger_version": "{self.ledger_version}"}}'.encode()
+        )
+
+
+@pytest.fixture
+def monitor():
+    """Create a real blockchain monitor with minimal configuration."""
+    config = SimpleNamespace(BLOCKCHAIN={"POLLING_INTERVAL": 60}, MONITOR={})
+    return BlockchainMonitor(config)
+
+
+class TestLatestVersionLoops:
+    """The node client must only be used from the monitor's polling loop."""
+
+    def test_api_and_poll_loop_share_client(self, monitor, monkeypatch):
+        """Test the API's latest version caller and the poll loop both reach the client."""
+        from api import routes
+
+        client = LoopBoundClient(42)
+        monitor.client = SimpleNamespace(client=client)
+        # Fail loudly instead of hiding a loop error behind the sync fallback
+        monkeypatch.setattr(monitor.session, "get", lambda *args, **kwargs: pytest.fail("sync fallback used"))
+
+        # Polling uses the client first, which binds it to the polling loop
+        assert monitor.run_on_poll_loop(monitor.get_latest_version(max_age=0)) == 42
+
+        routes.initialize_modules(monitor, None, None)
+        try:
+            # The API asks from a request thread with its own running loop elsewhere
+            assert routes._latest_version_caller() == 42
+            assert asyncio.run(asyncio.to_thread(routes._latest_version_caller)) == 42
+        finally:
+            routes.initialize_modules(None, None, None)
+
+        assert monitor.run_on_poll_loop(monitor.get_latest_version(max_age=0)) == 42
+        assert client.loop is monitor._get_poll_loop()
+
+
+def _event(event_id, category="nft_sale", account="0x1", **fields):
+    """Build a minimal enriched event."""
+    return dict(fields, id=event_id, event_category=category, account=account)
+
+
+def _hashable(value):
+    """Return True if value can be an index key."""
+    return not isinstance(value, (list, dict, set))
+
+
+def _assert_aggregates_match(monitor):
+    """Check the index and rolling counters describe exactly the events in the deque."""
+    events = list(monitor.recent_events)
+    ids = {event["id"] for event in events}
+    assert set(monitor.recent_events_by_id) == ids
+    assert set(monitor.recent_event_seq) == ids
+    assert set(monitor.recent_event_epochs) == ids
+
+    expected_counts = {}
+    for event in events:
+        category = event.get("event_category", "other")
+        if not _hashable(category):
+            category = "other"
+        expected_counts[category] = expected_counts.get(category, 0) + 1
+    assert dict(monitor.recent_category_counts) == expected_counts
+
+    for field, index in monitor.recent_field_index.items():
+        expected = {}
+        for event in events:
+            if field in event and _hashable(event[field]):
+                expected.setdefault(event[field], set()).add(event["id"])
+        assert index == expected
+
+
+class TestRecentEventIndex:
+    """Test cases for the recent events deque, inverted index and rolling counters."""
+
+    def test_aggregates_follow_eviction(self, monitor):
+        """Test evicted events leave the index and counters."""
+        maxlen = monitor.recent_events.maxlen
+        for i in range(maxlen + 25):
+            monitor.add_recent_event(_event(
+                f"e{i}", category=("nft_sale", "coin_transfer", "other")[i % 3],
+                account=f"0x{i % 7}", token_name=f"token{i % 4}"
+            ))
+
+        assert len(monitor.recent_events) == maxlen
+        assert monitor.recent_events[0]["id"] == "e25"
+        assert "e0" not in monitor.recent_events_by_id
+        _assert_aggregates_match(monitor)
+
+    def test_unhashable_values_are_not_indexed(self, monitor):
+        """Test an event with list or dict field values can be added and later evicted."""
+        monitor.add_recent_event(_event("bad", category={"kind": "sale"}, account=["0x1"]))
+        for i in range(monitor.recent_events.maxlen + 5):
+            assert monitor.add_recent_event(_event(f"e{i}")) is True
+
+        assert "bad" not in monitor.recent_events_by_id
+        _assert_aggregates_match(monitor)
+
+    def test_find_recent_events(self, monitor):
+        """Test lookups intersect the filters and return events oldest first."""
+        monitor.add_recent_event(_event("a", category="nft_sale", account="0x1"))
+        monitor.add_recent_event(_event("b", category="coin_transfer", account="0x1"))
+        monitor.add_recent_event(_event("c", category="nft_sale", account="0x2"))
+        monitor.add_recent_event(_event("d", category="nft_sale", account="0x1"))
+
+        hits = monitor.find_recent_events([("event_category", "nft_sale"), ("account", "0x1")])
+        assert [event["id"] for event in hits] == ["a", "d"]
+        assert monitor.find_recent_events([("account", "0x9")]) == []
+
+    def test_top_recent_values(self, monitor):
+        """Test the most common field values are ranked by event count."""
+        for i, account in enumerate(["0x1", "0x2", "0x1", "0x3", "0x1", "0x2"]):
+            monitor.add_recent_event(_event(f"e{i}", account=account))
+
+        assert monitor.top_recent_values("account", n=2) == {"0x1": 3, "0x2": 2}
+
+    def test_concurrent_adds_keep_aggregates_consistent(self, monitor):
+        """Test adds from many threads never leave ghost ids or negative counts."""
+        import sys
+        import threading
+
+        def add_events(worker):
+            for i in range(500):
+                monitor.add_recent_event(_event(
+                    f"{worker}-{i}", category=("nft_sale", "coin_transfer")[i % 2], account=f"0x{i % 5}"
+                ))
+
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=add_events, args=(worker,)) for worker in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(old_interval)
+
+        assert len(monitor.recent_events) == monitor.recent_events.maxlen
+        assert monitor.events_version == 8 * 500
+        _assert_aggregates_match(monitor)
+
+
+    def test_events_keep_no_internal_fields(self, monitor):
+        """Test the parsed timestamp is kept beside the event, not in it."""
+        event = _event("a", timestamp="2025-01-01T00:00:00+00:00")
+        monitor.add_recent_event(event)
+
+        assert not any(key.startswith("_") for key in monitor.recent_events[0])
+        assert monitor.recent_event_epoch(event) == 1735689600.0
+
+    def test_duplicate_ids_are_ignored(self, monitor):
+        """Test an event id already in the recent events is not added twice."""
+        assert monitor.add_recent_event(_event("a")) is True
+        assert monitor.add_recent_event(_event("a")) is False
+        assert len(monitor.recent_events) == 1
+        assert monitor.events_version == 1
+
+    def test_evicted_ids_can_return(self, monitor):
+        """Test an id is only deduplicated while its event is still recent."""
+        monitor.add_recent_event(_event("a"))
+        for i in range(monitor.recent_events.maxlen):
+            monitor.add_recent_event(_event(f"e{i}"))
+
+        assert monitor.add_recent_event(_event("a")) is True
+
+class TestSnapshot:
+    """Test cases for the cached monitor snapshot."""
+
+    def test_activity_is_a_top_ten_copy(self, monitor):
+        """Test the snapshot holds copies of the busiest accounts, unaffected by later updates."""
+        for i in range(12):
+            for _ in range(i + 1):
+                with monitor._recent_lock:
+                    monitor._update_metrics({"event_category": "nft_sale", "account": f"0x{i}"})
+
+        top = monitor.snapshot()["top_account_activity"]
+        assert list(top) == [f"0x{i}" for i in range(11, 1, -1)]
+
+        with monitor._recent_lock:
+            monitor._update_metrics({"event_category": "coin_transfer", "account": "0x11"})
+        assert top["0x11"]["total_events"] == 12
+        assert top["0x11"]["event_types"] == {"nft_sale": 12}
+
+
+class TestEventsWindow:
+    """Test cases for the 24 hour event window."""
+
+    def _timestamp(self, hours_ago):
+        """Return an ISO timestamp the given number of hours in the past."""
+        from datetime import datetime, timedelta, timezone
+        return (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat()
+
+    def test_window_counts_recent_timestamps(self, monitor):
+        """Test only events from the last 24 hours with a usable timestamp are counted."""
+        for i, hours_ago in enumerate([1, 30, 2]):
+            monitor.add_recent_event(_event(f"e{i}", timestamp=self._timestamp(hours_ago)))
+        monitor.add_recent_event(_event("bad", timestamp="not a timestamp"))
+        monitor.add_recent_event(_event("missing"))
+
+        assert monitor.tick_24h_window() == 2
+
+    def test_out_of_order_events_stay_sorted(self, monitor):
+        """Test backfilled events are placed in timestamp order and expire correctly."""
+        import time
+
+        for i, hours_ago in enumerate([1, 5, 3, 0.5, 4]):
+            monitor.add_recent_event(_event(f"e{i}", timestamp=self._timestamp(hours_ago)))
+
+        window = list(monitor.events_24h_times)
+        assert window == sorted(window)
+        # 21.5 hours from now, only the events from the last 2.5 hours remain
+        assert monitor.tick_24h_window(time.time() + 21.5 * 3600) == 2
+
+    def test_window_is_trimmed_on_add(self, monitor, monkeypatch):
+        """Test the window drops expired entries even when nothing reads it."""
+        import time
+
+        monitor.add_recent_event(_event("old", timestamp=self._timestamp(1)))
+        later = time.time() + 24 * 3600
+        monkeypatch.setattr("modules.blockchain.time.time", lambda: later)
+        monitor.add_recent_event(_event("new", timestamp=self._timestamp(-24)))
+
+        assert len(monitor.events_24h_times) == 1
+
+
+class TestLastProcessedVersion:
+    """Test cases for persisting the last processed version."""
+
+    def test_save_replaces_file_atomically(self, monitor, tmp_path, monkeypatch):
+        """Test the version is written through a temporary file that is renamed into place."""
+        version_file = tmp_path / "last_version.txt"
+        version_file.write_text("100")
+        monkeypatch.setattr("modules.blockchain.LAST_VERSION_FILE", str(version_file))
+
+        monitor._save_last_processed_version(12345)
+
+        assert version_file.read_text() == "12345"
+        assert not (tmp_path / "last_version.txt.tmp").exists()
+        assert monitor._get_last_processed_version() == 12345
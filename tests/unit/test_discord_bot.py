@@ -0,0 +1,55 @@
+"""
+Unit tests for the real DiscordBot's posting helpers.
+"""
+
+import discord
+import pytest
+from types import SimpleNamespace
+
+from modules.discord_bot import DiscordBot, MAX_EMBED_CHARS_PER_MESSAGE, _chunk_embeds
+
+
+@pytest.fixture
+def bot():
+    """Create a Discord bot with minimal configuration."""
+    return DiscordBot(SimpleNamespace(DISCORD={"PREFIX": "!", "CHANNEL_ID": 1}), None)
+
+
+class TestMarkPosted:
+    """Test cases for the posted event LRU."""
+
+    def test_duplicates_are_rejected(self, bot):
+        """Test an id is only accepted the first time."""
+        assert bot._mark_posted("a") is True
+        assert bot._mark_posted("a") is False
+
+    def test_oldest_id_is_forgotten(self, bot):
+        """Test the least recently seen id is evicted once the LRU is full."""
+        bot._mark_posted("a", max_size=2)
+        bot._mark_posted("b", max_size=2)
+        # Seeing "a" again makes "b" the oldest
+        assert bot._mark_posted("a", max_size=2) is False
+        assert bot._mark_posted("c", max_size=2) is True
+
+        assert list(bot.posted_events) == ["a", "c"]
+        assert bot._mark_posted("b", max_size=2) is True
+
+
+class TestChunkEmbeds:
+    """Test cases for splitting embeds into Discord messages."""
+
+    def test_splits_on_embed_count(self):
+        """Test no message carries more than 10 embeds."""
+        embeds = [discord.Embed(title=f"Event {i}") for i in range(23)]
+
+        assert [len(chunk) for chunk in _chunk_embeds(embeds)] == [10, 10, 3]
+
+    def test_splits_on_character_total(self):
+        """Test no message carries more than Discord's embed character limit."""
+        embeds = [discord.Embed(title="Event", description="x" * 2000) for _ in range(5)]
+
+        chunks = list(_chunk_embeds(embeds))
+        assert sum(len(chunk) for chunk in chunks) == 5
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert sum(len(embed) for embed in chunk) <= MAX_EMBED_CHARS_PER_MESSAGE
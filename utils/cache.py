@@ -1,9 +1,10 @@
 # utils/cache.py
-import json
 import os
 from datetime import datetime
 import threading
 
+import orjson
+
 class Cache:
     """Simple cache implementation with file persistence."""
     
@@ -41,8 +42,8 @@ class Cache:
         # Persist to disk
         try:
             file_path = os.path.join(self.cache_dir, f"{key}.json")
-            with open(file_path, 'w') as f:
-                json.dump(cache_data, f)
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(cache_data, option=orjson.OPT_NON_STR_KEYS))
         except Exception as e:
             print(f"Error writing cache to disk: {str(e)}")
     
@@ -66,8 +67,8 @@ class Cache:
             file_path = os.path.join(self.cache_dir, f"{key}.json")
             
             if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    cache_data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    cache_data = orjson.loads(f.read())
                 
                 # Check ttl if set
                 if cache_data.get('ttl'):